@@ -1,34 +1,46 @@
 import os
+import atexit
+import errno
+import ctypes
 import subprocess
 import threading
 import json
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
 import shutil
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import functools
+import heapq
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QLabel,
     QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QAction,
     QDialog, QCheckBox, QLineEdit, QComboBox, QSystemTrayIcon, QStyle, QMenu,
-    QPlainTextEdit, QSizePolicy, QGroupBox, QFormLayout, QScrollArea,
+    QPlainTextEdit, QSizePolicy, QFormLayout, QScrollArea,
     QTabWidget, QTimeEdit
 )
 from PyQt5.QtGui import (
-    QIcon, QPixmap, QPainter, QPen, QPainterPath, QFont,
-    QTextCursor, QDesktopServices, QBrush, QColor
+    QIcon, QPixmap, QPainter, QFont, QDesktopServices, QIntValidator
 )
 from PyQt5.QtCore import (
-    Qt, pyqtSignal, QObject, QTimer, QUrl, QRectF, QPointF, QTime, QLocale
+    Qt, pyqtSignal, QObject, QTimer, QUrl, QTime, QLocale,
+    QFileSystemWatcher
 )
-from PyQt5.QtNetwork import QLocalServer
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from jsonschema import validate, ValidationError
-import math
+from jsonschema import Draft7Validator, ValidationError
+
+try:
+    import orjson  # Optional, faster JSON encoding for the settings file
+except ImportError:
+    orjson = None
 
 # -------------------- Global Variables and Functions -------------------- #
 
@@ -38,19 +50,113 @@ app_data_folder = os.path.join(
     'VideoConverterApp'
 )
 os.makedirs(app_data_folder, exist_ok=True)
+cache_folder = os.path.join(app_data_folder, 'cache')
+os.makedirs(cache_folder, exist_ok=True)
 
 settings_file = 'settings.json'
 settings_path = os.path.join(app_data_folder, settings_file)
+# Last settings read or written, keyed by the settings file's modification time
+settings_cache = {'mtime': None, 'data': None}
 log_file_path = os.path.join(app_data_folder, 'conversion_log.txt')
+encoder_cache_path = os.path.join(cache_folder, 'encoders.json')
+# Originals waiting for their retention time to pass, as [deletion time, path] pairs
+pending_deletions_path = os.path.join(app_data_folder, 'pending_deletions.json')
+# Originals of converted files not yet moved to backup or deleted
+pending_originals_path = os.path.join(app_data_folder, 'pending_originals.json')
+
+# Log file writes are buffered and flushed every LOG_FILE_FLUSH_SECONDS seconds,
+# or straight away for errors
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_FILE_FLUSH_SECONDS = 30
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps its own count of the bytes written, so the
+    rollover check doesn't have to query the file (or format the record a second
+    time) for every record, and that buffers its writes instead of flushing after
+    every record.
+    """
+    def __init__(self, *args, **kwargs):
+        self.flush_pending = False
+        super().__init__(*args, **kwargs)
+        self.bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        threading.Thread(target=self.flush_periodically, daemon=True).start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            record_size = len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if os.name == 'nt':
+                record_size += msg.count('\n')  # Written as \r\n
+            if 0 < self.maxBytes <= self.bytes_written + record_size and self.bytes_written > 0:
+                self.doRollover()
+                self.bytes_written = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.bytes_written += record_size
+            # Errors are written out immediately
+            self.flush_pending = record.levelno >= logging.ERROR
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        # Called after every record; only flush when an error was logged
+        if self.flush_pending:
+            self.flush_pending = False
+            super().flush()
+
+    def flush_periodically(self):
+        """
+        Flush buffered records to disk every LOG_FILE_FLUSH_SECONDS seconds.
+        """
+        while True:
+            time.sleep(LOG_FILE_FLUSH_SECONDS)
+            self.acquire()
+            try:
+                super().flush()
+            finally:
+                self.release()
+
 
 # Setup rotating log file
 logger = logging.getLogger('VideoConverterLogger')
 logger.setLevel(logging.INFO)
-log_handler = RotatingFileHandler(log_file_path, maxBytes=5*1024*1024, backupCount=5)  # 5 MB max size, 5 backups
+log_handler = FastRotatingFileHandler(log_file_path, maxBytes=5*1024*1024, backupCount=5, encoding='utf-8')  # 5 MB max size, 5 backups
 formatter = logging.Formatter('%(asctime)s - %(message)s')
 log_handler.setFormatter(formatter)
-logger.addHandler(log_handler)
 
+# Log records are queued and written to the file by a background thread, so
+# callers (including the conversion threads) never wait on disk I/O
+log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, log_handler)
+log_listener.start()
+log_listener_running = True
+
+def stop_log_listener():
+    """
+    Write out the queued log records and stop the listener thread. Safe to call
+    more than once; it also runs at exit in case the app didn't quit normally.
+    """
+    global log_listener_running
+    if log_listener_running:
+        log_listener_running = False
+        log_listener.stop()
+
+atexit.register(stop_log_listener)
+
+# Resources that resource_path found to be missing
+missing_resources = set()
+
+@functools.lru_cache(maxsize=32)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller.
@@ -63,8 +169,52 @@ def resource_path(relative_path):
     full_path = os.path.join(base_path, relative_path)
     if not os.path.exists(full_path):
         logger.warning(f"Resource file '{relative_path}' not found at path '{full_path}'.")
+        missing_resources.add(relative_path)
     return full_path
 
+def resource_exists(relative_path):
+    """
+    Whether a resource file exists, checked only once per resource (see resource_path).
+    """
+    resource_path(relative_path)
+    return relative_path not in missing_resources
+
+FFMPEG_PATH = resource_path('ffmpeg.exe')
+FFPROBE_PATH = resource_path('ffprobe.exe')
+
+@functools.lru_cache(maxsize=None)
+def load_icon(icon_path):
+    """
+    Load an icon file once and share the QIcon between all windows and dialogs.
+    """
+    return QIcon(icon_path)
+
+@functools.lru_cache(maxsize=None)
+def get_time_display_format():
+    """
+    Time format for the time pickers, following the system's 12 or 24-hour clock.
+    Looked up on first use, as QLocale needs the QApplication to exist.
+    """
+    system_time_format = QLocale().timeFormat(QLocale.ShortFormat)
+    if 'AP' in system_time_format or 'ap' in system_time_format:
+        return 'hh:mm AP'  # 12-hour format
+    return 'HH:mm'  # 24-hour format
+
+@functools.lru_cache(maxsize=8)
+def parse_settings_time(text):
+    """
+    Parse an "HH:MM" time from the settings. Only a few distinct values are ever
+    parsed, so the results are cached rather than running strptime on every check.
+    """
+    return datetime.strptime(text, "%H:%M").time()
+
+@functools.lru_cache(maxsize=None)
+def load_pixmap(image_path):
+    """
+    Load an image file once; later dialogs reuse the decoded QPixmap.
+    """
+    return QPixmap(image_path)
+
 def backup_settings():
     """
     Save a backup of the settings file.
@@ -74,102 +224,174 @@ def backup_settings():
         shutil.copy2(settings_path, backup_path)
         logger.info(f"Settings backup created at {backup_path}")
 
+# Schema for the settings file, with a validator built once instead of on every validation
+SETTINGS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "source_folder": {"type": "string"},
+        "destination_folder": {"type": "string"},
+        "backup_folder": {"type": "string"},
+        "auto_run": {"type": "boolean"},
+        "delete_after_conversion": {"type": "boolean"},
+        "retention_time": {"type": "integer", "minimum": 0},
+        "use_backup": {"type": "boolean"},
+        "output_format": {"type": "string"},
+        "video_codec": {"type": ["string", "null"]},
+        "hwaccel": {"type": ["string", "null"]},
+        "audio_codec": {"type": "string"},
+        "copy_only": {"type": "boolean"},
+        "locked": {"type": "boolean"},
+        "start_time": {"type": "string"},
+        "end_time": {"type": "string"},
+        "no_time_restrictions": {"type": "boolean"},
+        "threads_per_worker": {"type": "integer", "minimum": 0},
+        "max_parallel_jobs": {"type": "integer", "minimum": 0}
+    },
+    "required": ["auto_run", "delete_after_conversion", "retention_time",
+                 "use_backup", "output_format", "copy_only", "locked",
+                 "start_time", "end_time", "no_time_restrictions"]
+}
+SETTINGS_VALIDATOR = Draft7Validator(SETTINGS_SCHEMA)
+
 def validate_settings(settings):
     """
     Validate settings against a predefined schema.
     """
-    schema = {
-        "type": "object",
-        "properties": {
-            "source_folder": {"type": "string"},
-            "destination_folder": {"type": "string"},
-            "backup_folder": {"type": "string"},
-            "auto_run": {"type": "boolean"},
-            "delete_after_conversion": {"type": "boolean"},
-            "retention_time": {"type": "integer", "minimum": 0},
-            "use_backup": {"type": "boolean"},
-            "output_format": {"type": "string"},
-            "video_codec": {"type": ["string", "null"]},
-            "audio_codec": {"type": "string"},
-            "copy_only": {"type": "boolean"},
-            "locked": {"type": "boolean"},
-            "start_time": {"type": "string"},
-            "end_time": {"type": "string"},
-            "no_time_restrictions": {"type": "boolean"}
-        },
-        "required": ["auto_run", "delete_after_conversion", "retention_time",
-                     "use_backup", "output_format", "copy_only", "locked",
-                     "start_time", "end_time", "no_time_restrictions"]
-    }
-    validate(instance=settings, schema=schema)
+    SETTINGS_VALIDATOR.validate(settings)
+
+def dump_settings_json(settings):
+    """
+    Encode settings as compact JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(settings)
+    return json.dumps(settings, separators=(',', ':')).encode('utf-8')
+
+def parse_settings_json(data):
+    """
+    Decode the settings file's bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)  # Raises a subclass of json.JSONDecodeError
+    return json.loads(data)
 
 def save_settings(settings):
     """
-    Save settings to a JSON file.
+    Save settings to a JSON file. Nothing is written (or backed up) when the file
+    already holds these settings.
     """
     try:
         validate_settings(settings)
+        if (settings == settings_cache['data'] and os.path.exists(settings_path)
+                and os.stat(settings_path).st_mtime_ns == settings_cache['mtime']):
+            return
         backup_settings()
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=4)
+        # Write to a temporary file first so a crash can't leave a half-written settings file
+        temp_path = settings_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(dump_settings_json(settings))
+            f.flush()
+            os.fsync(f.fileno())  # Make sure the data is on disk before it replaces the old file
+        os.replace(temp_path, settings_path)
+        settings_cache.update(mtime=os.stat(settings_path).st_mtime_ns, data=dict(settings))
         logger.info("Settings saved successfully.")
     except ValidationError as e:
         logger.error(f"Settings validation error: {e.message}")
     except Exception as e:
         logger.error(f"Error saving settings: {e}")
 
+# Settings used when there is no (valid) settings file, and for missing keys
+DEFAULT_SETTINGS = {
+    'source_folder': '',
+    'destination_folder': '',
+    'backup_folder': '',
+    'auto_run': False,
+    'delete_after_conversion': False,
+    'retention_time': 0,
+    'use_backup': False,
+    'output_format': 'mp4',
+    'video_codec': 'libx264',
+    'hwaccel': None,
+    'audio_codec': 'aac',
+    'copy_only': False,
+    'locked': False,
+    'start_time': '00:00',
+    'end_time': '23:59',
+    'no_time_restrictions': True,
+    'threads_per_worker': 0,
+    'max_parallel_jobs': 0
+}
+
+# Settings the main window keeps as attributes of the same name
+APP_SETTING_ATTRIBUTES = (
+    'source_folder', 'destination_folder', 'backup_folder', 'auto_run',
+    'delete_after_conversion', 'retention_time', 'use_backup', 'output_format',
+    'video_codec', 'hwaccel', 'audio_codec', 'copy_only', 'start_time', 'end_time',
+    'no_time_restrictions', 'threads_per_worker'
+)
+
 def load_settings():
     """
     Load settings from a JSON file. Return default settings if file doesn't exist.
+    The file is only parsed again when it has changed since it was last read or written.
     """
-    default_settings = {
-        'source_folder': '',
-        'destination_folder': '',
-        'backup_folder': '',
-        'auto_run': False,
-        'delete_after_conversion': False,
-        'retention_time': 0,
-        'use_backup': False,
-        'output_format': 'mp4',
-        'video_codec': 'libx264',
-        'audio_codec': 'aac',
-        'copy_only': False,
-        'locked': False,
-        'start_time': '00:00',
-        'end_time': '23:59',
-        'no_time_restrictions': True
-    }
     if os.path.exists(settings_path):
         try:
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
+            mtime = os.stat(settings_path).st_mtime_ns
+            if mtime == settings_cache['mtime']:
+                return dict(settings_cache['data'])
+            with open(settings_path, 'rb') as f:
+                settings = parse_settings_json(f.read())
             validate_settings(settings)
+            settings_cache.update(mtime=mtime, data=dict(settings))
             return settings
         except (json.JSONDecodeError, ValidationError) as e:
             logger.error(f"Settings file is corrupted or invalid: {e}. Loading default settings.")
-            return default_settings
+            return dict(DEFAULT_SETTINGS)
         except Exception as e:
             logger.error(f"Error loading settings: {e}. Loading default settings.")
-            return default_settings
+            return dict(DEFAULT_SETTINGS)
     else:
-        return default_settings
+        return dict(DEFAULT_SETTINGS)
 
 class LogEmitter(QObject):
     """
-    Emits log messages to be displayed in the GUI.
+    Emits log messages to be displayed in the GUI. Messages are appended to
+    log_buffer and picked up by the GUI's flush timer.
     """
-    log_signal = pyqtSignal(str)
+    def __init__(self, log_buffer):
+        super().__init__()
+        self.log_buffer = log_buffer
+
+    def emit_log(self, message):
+        """
+        Hand a log message to the GUI, from any thread.
+        """
+        self.log_buffer.append(message)  # deque.append is thread-safe
+
+# Last formatted log timestamp, as (epoch second, text)
+timestamp_cache = (0, '')
+
+def log_timestamp():
+    """
+    Current time formatted for the log window. The text is only formatted again
+    once a second has passed since the previous call.
+    """
+    global timestamp_cache
+    second = int(time.time())
+    cached_second, text = timestamp_cache  # Read once; other threads may replace it
+    if second != cached_second:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        timestamp_cache = (second, text)
+    return text
 
 def log_message(message, emitter=None):
     """
     Log messages to both the log file and emit to the GUI (if emitter is provided).
     """
-    logger.info(message)
-    log_entry = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {message}"
+    logger.info(message)  # The log file gets its own timestamp from the formatter
     if emitter:
-        emitter.log_signal.emit(log_entry)
-    else:
-        print(log_entry)
+        emitter.emit_log(f"{log_timestamp()} - {message}")
 
 def get_subprocess_startupinfo():
     """
@@ -184,45 +406,272 @@ def get_subprocess_startupinfo():
         creationflags = 0
     return startupinfo, creationflags
 
-def get_supported_encoders():
+# Shared by all subprocess calls (Popen works on its own copy of the STARTUPINFO)
+STARTUPINFO, CREATIONFLAGS = get_subprocess_startupinfo()
+
+@functools.lru_cache(maxsize=128)
+def probe_audio_stream(file_path, size, mtime_ns):
+    """
+    Check with ffprobe whether a file has an audio stream. size and mtime_ns are
+    only part of the cache key, so a file is probed again once it has changed.
+    """
+    command = [FFPROBE_PATH, '-v', 'error', '-select_streams', 'a', '-show_entries',
+               'stream=codec_type', '-of', 'default=nw=1', file_path]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            startupinfo=STARTUPINFO, creationflags=CREATIONFLAGS)
+    return 'codec_type=audio' in result.stdout
+
+def copy_file(source, destination):
+    """
+    Copy a file with its timestamps. On Windows the copy is done by CopyFileW, which
+    copies in the kernel (and server-side on network shares) instead of streaming
+    the data through Python; elsewhere shutil.copy2 already uses the fast copy calls.
     """
-    Detect supported GPU encoders available in the current FFMPEG build.
-    Returns a dictionary with encoder information.
+    if os.name == 'nt':
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        if not kernel32.CopyFileW(source, destination, False):
+            raise ctypes.WinError(ctypes.get_last_error())
+    else:
+        shutil.copy2(source, destination)
+
+def move_file(source, destination):
+    """
+    Move a file. Files on the same volume are renamed in place; across volumes
+    the file is copied (see copy_file) under a temporary name next to the
+    destination, renamed into place and the original removed.
+    """
+    try:
+        os.replace(source, destination)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    # Different volume. A file already at the destination is only replaced once
+    # the copy is complete.
+    temp_path = destination + '.tmp'
+    try:
+        copy_file(source, temp_path)
+        os.replace(temp_path, destination)
+    except OSError:
+        # Don't leave a partial copy behind
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.remove(source)
+
+def detect_encoders():
+    """
+    Detect the encoders available in the current FFMPEG build.
+    Returns the set of encoder names, or None if ffmpeg couldn't be run.
     """
     try:
         # Retrieve the list of supported encoders
-        startupinfo, creationflags = get_subprocess_startupinfo()
-        result = subprocess.run(
-            [resource_path('ffmpeg.exe'), '-encoders'],
+        process = subprocess.Popen(
+            [FFMPEG_PATH, '-hide_banner', '-encoders'],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            check=True,
-            startupinfo=startupinfo,
-            creationflags=creationflags
+            startupinfo=STARTUPINFO,
+            creationflags=CREATIONFLAGS
         )
-        encoders = result.stdout.lower()
-        supported = {}
+        # Each encoder line looks like " V....D h264_nvenc   NVIDIA NVENC H.264 encoder",
+        # collect the encoder names while the listing is read
+        encoders = set()
+        with process:
+            for line in process.stdout:
+                fields = line.split(None, 2)
+                if len(fields) >= 2 and line.startswith((' V', ' A')):
+                    encoders.add(fields[1])
+            stderr = process.stderr.read()  # Only errors (no banner), well within the pipe buffer
+        if process.returncode != 0:
+            logger.error(f"Error detecting supported encoders: {stderr}")
+            return None
+        return encoders
+    except OSError as e:
+        logger.error(f"Error running ffmpeg to detect supported encoders: {e}")
+        return None
 
-        # Check for NVIDIA NVENC
-        if 'h264_nvenc' in encoders or 'hevc_nvenc' in encoders:
-            supported['nvidia'] = {'h264': 'h264_nvenc', 'hevc': 'hevc_nvenc'}
+def get_gpu_encoders(encoders):
+    """
+    Build the encoder information (encoders and options) of each GPU vendor whose
+    encoders are among the given encoder names.
+    """
+    supported = {}
+
+    # Check for NVIDIA NVENC
+    if 'h264_nvenc' in encoders or 'hevc_nvenc' in encoders:
+        supported['nvidia'] = {
+            'h264': 'h264_nvenc', 'hevc': 'hevc_nvenc',
+            # Decode on the GPU as well; the frames are copied back to system memory,
+            # so inputs whose pixel format the encoder can't take from CUDA still work
+            'input_options': ['-hwaccel', 'cuda'],
+            'output_options': ['-preset', 'p5', '-rc', 'vbr']
+        }
 
-        # Check for Intel QSV
-        if 'h264_qsv' in encoders or 'hevc_qsv' in encoders:
-            supported['intel'] = {'h264': 'h264_qsv', 'hevc': 'hevc_qsv'}
+    # Check for Intel QSV
+    if 'h264_qsv' in encoders or 'hevc_qsv' in encoders:
+        supported['intel'] = {
+            'h264': 'h264_qsv', 'hevc': 'hevc_qsv',
+            'output_options': ['-preset', 'medium']
+        }
+
+    # Check for AMD VCE/VCN
+    if 'h264_amf' in encoders or 'hevc_amf' in encoders:
+        supported['amd'] = {
+            'h264': 'h264_amf', 'hevc': 'hevc_amf',
+            'output_options': ['-quality', 'balanced']
+        }
 
-        # Check for AMD VCE/VCN
-        if 'h264_amf' in encoders or 'hevc_amf' in encoders:
-            supported['amd'] = {'h264': 'h264_amf', 'hevc': 'hevc_amf'}
+    # Check for Apple VideoToolbox
+    if 'h264_videotoolbox' in encoders or 'hevc_videotoolbox' in encoders:
+        supported['apple'] = {
+            'h264': 'h264_videotoolbox', 'hevc': 'hevc_videotoolbox',
+            'input_options': ['-hwaccel', 'videotoolbox']
+        }
+
+    return supported
+
+def load_supported_encoders():
+    """
+    Return the supported GPU encoders (see get_gpu_encoders). ffmpeg's encoder names
+    are cached on disk together with its size and modification time, so ffmpeg only
+    has to be probed again when it has been replaced. The one-file PyInstaller build
+    extracts ffmpeg anew on every launch, so there only the size is compared.
+    """
+    try:
+        ffmpeg_stat = os.stat(FFMPEG_PATH)
+    except OSError:
+        logger.error(f"ffmpeg not found at '{FFMPEG_PATH}'.")
+        return {}
+    if hasattr(sys, '_MEIPASS'):
+        ffmpeg_key = [ffmpeg_stat.st_size]
+    else:
+        ffmpeg_key = [ffmpeg_stat.st_size, ffmpeg_stat.st_mtime_ns]
 
-        return supported
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error detecting supported encoders: {e.stderr}")
+    try:
+        with open(encoder_cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached['ffmpeg_key'] == ffmpeg_key:
+            return get_gpu_encoders(set(cached['encoder_names']))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable cache, probe ffmpeg
+
+    encoders = detect_encoders()
+    if encoders is None:
         return {}
+    try:
+        with open(encoder_cache_path, 'w') as f:
+            json.dump({'ffmpeg_key': ffmpeg_key, 'encoder_names': sorted(encoders)}, f, indent=4)
+    except OSError as e:
+        logger.error(f"Error caching supported encoders: {e}")
+    return get_gpu_encoders(encoders)
+
+# Supported GPU encoders once loaded. The lock makes callers that arrive while
+# ffmpeg is being probed wait for that probe instead of starting another one.
+supported_encoders = None
+encoder_probe_lock = threading.Lock()
+
+def get_supported_encoders():
+    """
+    Return the supported GPU encoders, loading them on the first call.
+    """
+    global supported_encoders
+    with encoder_probe_lock:
+        if supported_encoders is None:
+            supported_encoders = load_supported_encoders()
+        return supported_encoders
+
+@functools.lru_cache(maxsize=1)
+def get_hw_encoder_vendors():
+    """
+    Map each supported hardware encoder to its vendor, e.g. 'hevc_nvenc' -> 'nvidia'.
+    """
+    return {
+        encoder[codec]: vendor
+        for vendor, encoder in get_supported_encoders().items()
+        for codec in ('h264', 'hevc')
+    }
+
+# Video file extensions picked up in the source folder
+SUPPORTED_FORMATS = frozenset((
+    '.mp4', '.avi', '.wmv', '.mkv', '.flv', '.webm', '.mov', '.mpeg',
+    '.mpg', '.m4v', '.3gp', '.ts', '.vob', '.rm', '.rmvb', '.asf',
+    '.m2ts', '.mts', '.ogv', '.divx', '.dv', '.f4v', '.mxf', '.nut',
+    '.ogm', '.qt', '.tod', '.vro'
+))
+
+# Codecs offered in the settings, and the default codecs of each output format
+VIDEO_CODECS = ['libx264', 'mpeg4', 'libvpx', 'hevc', 'flv', 'mpeg2video', 'h263', 'theora', 'wmv2']
+AUDIO_CODECS = ['aac', 'mp3', 'ac3', 'opus', 'vorbis', 'mp2', 'amr_nb', 'wmav2', 'libmp3lame']
+CODEC_MAP = {
+    'mp4': {'video': 'libx264', 'audio': 'aac'},
+    'mov': {'video': 'libx264', 'audio': 'aac'},
+    'avi': {'video': 'mpeg4', 'audio': 'mp3'},
+    'mkv': {'video': 'libx264', 'audio': 'aac'},
+    'mp3': {'video': None, 'audio': 'libmp3lame'}  # No video codec for mp3
+}
+DEFAULT_CODECS = {'video': 'libx264', 'audio': 'aac'}
+
+# Maximum number of files converted at the same time. Capped so that parallel
+# ffmpeg processes don't thrash the disks. The 'max_parallel_jobs' setting
+# overrides it when it isn't 0.
+MAX_PARALLEL = min(os.cpu_count() or 1, 4)
+MAX_PARALLEL_JOBS = 16
+
+# Each ffmpeg process gets an equal share of the cores when several files are
+# converted at once, so the encoders together don't oversubscribe the CPU
+# (ffmpeg would otherwise use every core each). A file converted on its own gets
+# all cores (0 lets ffmpeg decide). The 'threads_per_worker' setting overrides
+# both when it isn't 0.
+FFMPEG_THREADS_SINGLE = 0
+MAX_THREADS_PER_WORKER = 64
+
+# The source folder is rescanned when the file system watcher reports a change.
+# A full rescan still happens every SCAN_FALLBACK_INTERVAL seconds in case an
+# event is missed (e.g. on network shares), and changes are given
+# SCAN_SETTLE_TIME seconds to settle so files still being copied are skipped.
+SCAN_FALLBACK_INTERVAL = 30
+SCAN_SETTLE_TIME = 2
+
+# Make ffmpeg report progress as key=value lines on stdout and keep its log
+# output down to errors, instead of the per-frame status line and banner
+FFMPEG_PROGRESS_OPTIONS = ['-nostats', '-loglevel', 'error', '-progress', 'pipe:1']
+# Input options that let ffmpeg read past minor damage (missing timestamps,
+# corrupt packets) instead of failing; files it still can't read because of a
+# broken container are remuxed and converted again
+FFMPEG_INPUT_OPTIONS = ['-fflags', '+genpts', '-err_detect', 'ignore_err']
+FFMPEG_COMMAND_PREFIX = (FFMPEG_PATH, '-y', *FFMPEG_PROGRESS_OPTIONS, *FFMPEG_INPUT_OPTIONS)
+FFMPEG_PROGRESS_LINE = re.compile(rb'\w+=')  # e.g. b"frame=120", b"progress=end"
+# ffmpeg errors that point at a damaged container (rather than e.g. a missing
+# encoder or a full disk), which a plain remux of the input can repair
+FFMPEG_CONTAINER_ERROR = re.compile(
+    r'Invalid data found when processing input|moov atom not found|error reading header|'
+    r'could not find codec parameters|EBML header parsing failed|Header missing|'
+    r'Packet corrupt|Truncating packet|non[- ]monoton',
+    re.IGNORECASE
+)
+# Progress of a running conversion is logged at most every PROGRESS_LOG_INTERVAL seconds
+PROGRESS_LOG_INTERVAL = 10
+
+# Popen options for the conversion processes: no inherited handles, a large
+# pipe buffer to cut down reader wake-ups, and (on POSIX) a separate session
+# so the process can be killed cleanly
+FFMPEG_POPEN_OPTIONS = {'close_fds': True, 'bufsize': 1024 * 1024}
+if os.name != 'nt':
+    FFMPEG_POPEN_OPTIONS['start_new_session'] = True
+
+# Settings changes are written this many seconds after the last change, so a
+# burst of changes results in a single write
+SETTINGS_SAVE_DELAY = 0.5
+
+# Log lines kept in the console window, and how often (in milliseconds) queued
+# lines are written to it
+MAX_LOG_LINES = 1000
+LOG_FLUSH_INTERVAL = 100
 
-# Cache the supported encoders to avoid redundant calls
-GPU_ENCODERS = get_supported_encoders()
+# Converted files waiting to have their original backed up or deleted. When the
+# queue is full the conversion workers wait for the post-processing thread.
+POST_QUEUE_SIZE = 64
 
 # -------------------- Easter Egg Dialog -------------------- #
 class EasterEggDialog(QDialog):
@@ -239,8 +688,8 @@ class EasterEggDialog(QDialog):
     def init_ui(self):
         # Load team.png
         team_image_path = resource_path('team.png')  # Ensure the filename matches
-        if os.path.exists(team_image_path):
-            team_pixmap = QPixmap(team_image_path)
+        if resource_exists('team.png'):
+            team_pixmap = load_pixmap(team_image_path)
         else:
             team_pixmap = QPixmap()
             log_message(f"Team image not found at path '{team_image_path}'.", None)
@@ -273,7 +722,7 @@ class EasterEggDialog(QDialog):
         # Initialize QMediaPlayer
         self.media_player = QMediaPlayer(self)
         audio_file_path = resource_path('paradise.mp3')  # Ensure the filename matches
-        if os.path.exists(audio_file_path):
+        if resource_exists('paradise.mp3'):
             url = QUrl.fromLocalFile(audio_file_path)
             media_content = QMediaContent(url)
             self.media_player.setMedia(media_content)
@@ -299,8 +748,8 @@ class ConfirmationDialog(QDialog):
     def __init__(self, action, icon_path, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Confirm")
-        if icon_path and os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if icon_path:  # None when the icon file is missing
+            self.setWindowIcon(load_icon(icon_path))
         else:
             self.setWindowIcon(QIcon())
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove question mark
@@ -336,7 +785,7 @@ class InfoDialog(QDialog):
         self.setWindowTitle("About Video Converter")
         # Set minimum size for dynamic resizing
         self.setMinimumSize(400, 260)
-        self.setWindowIcon(QIcon(resource_path('info_icon.ico')))
+        self.setWindowIcon(load_icon(resource_path('info_icon.ico')))
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove question mark
         self.init_ui()
 
@@ -373,19 +822,32 @@ class InfoDialog(QDialog):
 
 # -------------------- Settings Dialog -------------------- #
 
+class InfoLabel(QLabel):
+    """
+    Indented, word-wrapped description shown below a setting.
+    """
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setWordWrap(True)
+        self.setIndent(20)
+
 class SettingsDialog(QDialog):
     settings_saved = pyqtSignal(dict)
     backup_usage_changed = pyqtSignal(bool)  # Signal to inform main window of backup usage change
 
-    def __init__(self, current_settings, parent=None):
+    def __init__(self, current_settings, parent=None, hw_encoder_vendors=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.resize(400, 300)  # Adjusted size to accommodate the new tab
-        self.setWindowIcon(QIcon(resource_path('settings_logo.ico')))
+        self.setWindowIcon(load_icon(resource_path('settings_logo.ico')))
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove question mark
         self.current_settings = current_settings
+        self.hw_encoder_vendors = {}  # Hardware encoders offered as video codecs
         self.easter_egg_dialog = None  # Keep a reference to the Easter egg dialog
+        self.last_backup_usage = None  # Last value sent through backup_usage_changed
         self.init_ui()
+        if hw_encoder_vendors:
+            self.add_hw_encoders(hw_encoder_vendors)
 
     def init_ui(self):
         main_layout = QVBoxLayout()
@@ -442,18 +904,14 @@ class SettingsDialog(QDialog):
         self.auto_run_checkbox = QCheckBox("Auto Run on Startup")
         self.auto_run_checkbox.setChecked(self.current_settings.get('auto_run', False))
 
-        auto_run_info = QLabel("Automatically start the application with previous settings.")
-        auto_run_info.setWordWrap(True)
-        auto_run_info.setIndent(20)  # Indent the info text
+        auto_run_info = InfoLabel("Automatically start the application with previous settings.")
 
         # Copy Only Option
         self.copy_only_checkbox = QCheckBox("Copy only")
         self.copy_only_checkbox.setChecked(self.current_settings.get('copy_only', False))
         self.copy_only_checkbox.stateChanged.connect(self.toggle_copy_only)
 
-        copy_only_info = QLabel("Copy files without converting them.")
-        copy_only_info.setWordWrap(True)
-        copy_only_info.setIndent(20)
+        copy_only_info = InfoLabel("Copy files without converting them.")
 
         layout.addWidget(self.auto_run_checkbox)
         layout.addWidget(auto_run_info)
@@ -535,9 +993,7 @@ class SettingsDialog(QDialog):
         self.delete_after_checkbox.setChecked(self.current_settings.get('delete_after_conversion', False))
         self.delete_after_checkbox.stateChanged.connect(self.toggle_retention)
 
-        delete_info = QLabel("Delete original files after successful conversion.")
-        delete_info.setWordWrap(True)
-        delete_info.setIndent(20)  # Indent the info text
+        delete_info = InfoLabel("Delete original files after successful conversion.")
 
         layout.addWidget(self.delete_after_checkbox)
         layout.addWidget(delete_info)
@@ -554,9 +1010,7 @@ class SettingsDialog(QDialog):
 
         retention_form_layout.addRow(self.retention_label, self.retention_input)
 
-        retention_info = QLabel("Time in days to retain original files before deletion (0-30).")
-        retention_info.setWordWrap(True)
-        retention_info.setIndent(20)
+        retention_info = InfoLabel("Time in days to retain original files before deletion (0-30).")
 
         layout.addLayout(retention_form_layout)
         layout.addWidget(retention_info)
@@ -567,9 +1021,7 @@ class SettingsDialog(QDialog):
         self.use_backup_checkbox.setEnabled(not (self.delete_after_checkbox.isChecked() and int(self.retention_input.text()) == 0))
         self.use_backup_checkbox.stateChanged.connect(self.toggle_backup)
 
-        backup_info = QLabel("Move original files to a backup folder after conversion.")
-        backup_info.setWordWrap(True)
-        backup_info.setIndent(20)
+        backup_info = InfoLabel("Move original files to a backup folder after conversion.")
 
         layout.addWidget(self.use_backup_checkbox)
         layout.addWidget(backup_info)
@@ -594,9 +1046,7 @@ class SettingsDialog(QDialog):
 
         output_form_layout.addRow(output_format_label, self.output_format_combo)
 
-        output_format_info = QLabel("Select the output format for the converted files.")
-        output_format_info.setWordWrap(True)
-        output_format_info.setIndent(20)
+        output_format_info = InfoLabel("Select the output format for the converted files.")
 
         layout.addLayout(output_form_layout)
         layout.addWidget(output_format_info)
@@ -605,15 +1055,14 @@ class SettingsDialog(QDialog):
         video_codec_form_layout = QFormLayout()
         video_codec_label = QLabel("    Video Codec:")
         self.video_codec_combo = QComboBox()
-        self.video_codec_combo.addItems(['libx264', 'mpeg4', 'libvpx', 'hevc', 'flv', 'mpeg2video', 'h263', 'theora', 'wmv2'])
+        self.video_codec_combo.addItems(VIDEO_CODECS)
+        self.video_codec_index = {codec: i for i, codec in enumerate(VIDEO_CODECS)}
         self.video_codec_combo.setCurrentText(self.current_settings.get('video_codec', 'libx264'))
         self.video_codec_combo.setMaximumWidth(75)
 
         video_codec_form_layout.addRow(video_codec_label, self.video_codec_combo)
 
-        video_codec_info = QLabel("Select the video codec for conversion.")
-        video_codec_info.setWordWrap(True)
-        video_codec_info.setIndent(20)
+        video_codec_info = InfoLabel("Select the video codec for conversion. Hardware encoders (nvenc, qsv, amf, videotoolbox) use the graphics card.")
 
         layout.addLayout(video_codec_form_layout)
         layout.addWidget(video_codec_info)
@@ -622,19 +1071,47 @@ class SettingsDialog(QDialog):
         audio_codec_form_layout = QFormLayout()
         audio_codec_label = QLabel("   Audio Codec:")
         self.audio_codec_combo = QComboBox()
-        self.audio_codec_combo.addItems(['aac', 'mp3', 'ac3', 'opus', 'vorbis', 'mp2', 'amr_nb', 'wmav2', 'libmp3lame'])
+        self.audio_codec_combo.addItems(AUDIO_CODECS)
+        self.audio_codec_index = {codec: i for i, codec in enumerate(AUDIO_CODECS)}
         self.audio_codec_combo.setCurrentText(self.current_settings.get('audio_codec', 'aac'))
         self.audio_codec_combo.setMaximumWidth(75)
 
         audio_codec_form_layout.addRow(audio_codec_label, self.audio_codec_combo)
 
-        audio_codec_info = QLabel("Select the audio codec for conversion.")
-        audio_codec_info.setWordWrap(True)
-        audio_codec_info.setIndent(20)
+        audio_codec_info = InfoLabel("Select the audio codec for conversion.")
 
         layout.addLayout(audio_codec_form_layout)
         layout.addWidget(audio_codec_info)
 
+        # Threads per conversion
+        threads_form_layout = QFormLayout()
+        threads_label = QLabel("Threads per file:")
+        self.threads_input = QLineEdit(str(self.current_settings.get('threads_per_worker', 0)))
+        self.threads_input.setValidator(QIntValidator(0, MAX_THREADS_PER_WORKER, self))
+        self.threads_input.setMaximumWidth(50)
+
+        threads_form_layout.addRow(threads_label, self.threads_input)
+
+        threads_info = InfoLabel(f"CPU threads used by each conversion (0 = automatic, up to {MAX_THREADS_PER_WORKER}).")
+
+        layout.addLayout(threads_form_layout)
+        layout.addWidget(threads_info)
+
+        # Parallel conversions
+        parallel_form_layout = QFormLayout()
+        parallel_label = QLabel("Parallel conversions:")
+        self.parallel_input = QLineEdit(str(self.current_settings.get('max_parallel_jobs', 0)))
+        self.parallel_input.setValidator(QIntValidator(0, MAX_PARALLEL_JOBS, self))
+        self.parallel_input.setMaximumWidth(50)
+
+        parallel_form_layout.addRow(parallel_label, self.parallel_input)
+
+        parallel_info = InfoLabel(f"Number of files converted at the same time (0 = automatic, up to {MAX_PARALLEL_JOBS}). "
+                                  "Lower it if the graphics card limits the number of encoding sessions.")
+
+        layout.addLayout(parallel_form_layout)
+        layout.addWidget(parallel_info)
+
         # Disable codecs if "Copy only" is selected
         self.toggle_copy_only(self.copy_only_checkbox.isChecked())
 
@@ -647,20 +1124,9 @@ class SettingsDialog(QDialog):
         layout.setSpacing(10)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        time_info = QLabel("Restrict conversion to specific times of the day.")
-        time_info.setWordWrap(True)
-        time_info.setIndent(20)
-
-        # Get system time format
-        locale = QLocale()
-        system_time_format = locale.timeFormat(QLocale.ShortFormat)
-        # Determine if the system uses 12-hour or 24-hour format
-        if 'AP' in system_time_format or 'ap' in system_time_format:
-            # 12-hour format
-            time_display_format = 'hh:mm AP'
-        else:
-            # 24-hour format
-            time_display_format = 'HH:mm'
+        time_info = InfoLabel("Restrict conversion to specific times of the day.")
+
+        time_display_format = get_time_display_format()
 
         # No Time Restrictions Checkbox
         self.no_time_restrictions_checkbox = QCheckBox("No Time Restrictions")
@@ -721,6 +1187,7 @@ class SettingsDialog(QDialog):
         self.retention_time_changed(self.retention_input.text())
 
     def retention_time_changed(self, text):
+        # The field takes free text (no QIntValidator) because the Easter egg code is typed into it
         retention_time = int(text) if text.isdigit() else 0
         if self.delete_after_checkbox.isChecked():
             if retention_time == 0:
@@ -728,7 +1195,7 @@ class SettingsDialog(QDialog):
                 if self.use_backup_checkbox.isEnabled():
                     self.use_backup_checkbox.setEnabled(False)
                     self.use_backup_checkbox.setChecked(False)
-                    self.backup_usage_changed.emit(False)
+                    self.emit_backup_usage(False)
             else:
                 # Retention time > 0, enable Use Backup Folder
                 if not self.use_backup_checkbox.isEnabled():
@@ -758,22 +1225,40 @@ class SettingsDialog(QDialog):
 
     def toggle_backup(self, state):
         enabled = state == Qt.Checked
-        self.backup_usage_changed.emit(enabled)
+        self.emit_backup_usage(enabled)
         # Keep the backup folder path intact
 
+    def emit_backup_usage(self, enabled):
+        """
+        Tell the main window whether the backup folder is used, unless it already knows.
+        """
+        if enabled != self.last_backup_usage:
+            self.last_backup_usage = enabled
+            self.backup_usage_changed.emit(enabled)
+
     def update_codecs(self, format_selected):
-        codec_map = {
-            'mp4': {'video': 'libx264', 'audio': 'aac'},
-            'mov': {'video': 'libx264', 'audio': 'aac'},
-            'avi': {'video': 'mpeg4', 'audio': 'mp3'},
-            'mkv': {'video': 'libx264', 'audio': 'aac'},
-            'mp3': {'video': None, 'audio': 'libmp3lame'}  # No video codec for mp3
-        }
-        codecs = codec_map.get(format_selected, {'video': 'libx264', 'audio': 'aac'})
+        codecs = CODEC_MAP.get(format_selected, DEFAULT_CODECS)
         self.video_codec_combo.setEnabled(codecs['video'] is not None)
         if codecs['video']:
-            self.video_codec_combo.setCurrentText(codecs['video'])
-        self.audio_codec_combo.setCurrentText(codecs['audio'])
+            self.video_codec_combo.setCurrentIndex(self.video_codec_index[codecs['video']])
+        self.audio_codec_combo.setCurrentIndex(self.audio_codec_index[codecs['audio']])
+
+    def add_hw_encoders(self, hw_encoder_vendors):
+        """
+        Offer the hardware encoders detected in ffmpeg as video codecs.
+        """
+        new_encoders = [encoder for encoder in hw_encoder_vendors if encoder not in self.video_codec_index]
+        if not new_encoders:
+            return
+        self.hw_encoder_vendors.update(hw_encoder_vendors)
+        for encoder in new_encoders:
+            self.video_codec_index[encoder] = self.video_codec_combo.count()
+            self.video_codec_combo.addItem(encoder)
+        self.video_codec_combo.setMaximumWidth(140)
+        # The saved codec may be one of the encoders that just became available
+        saved_codec = self.current_settings.get('video_codec')
+        if saved_codec in new_encoders:
+            self.video_codec_combo.setCurrentIndex(self.video_codec_index[saved_codec])
 
     def toggle_copy_only(self, state):
         enabled = state != Qt.Checked
@@ -783,20 +1268,34 @@ class SettingsDialog(QDialog):
         # Additionally, update conversion tab UI if necessary
 
     def set_defaults(self):
-        self.auto_run_checkbox.setChecked(False)
-        self.delete_after_checkbox.setChecked(True)
-        self.use_backup_checkbox.setChecked(False)
-        self.retention_input.setText('0')
-        self.output_format_combo.setCurrentText('mov')
-        self.video_codec_combo.setCurrentText('libx264')
-        self.audio_codec_combo.setCurrentText('aac')
-        self.copy_only_checkbox.setChecked(False)  # Reset copy_only to default
-        self.start_time_edit.setTime(QTime.fromString('00:00', 'HH:mm'))
-        self.end_time_edit.setTime(QTime.fromString('23:59', 'HH:mm'))
-        self.no_time_restrictions_checkbox.setChecked(True)
-        # Do not reset the folder paths
-        self.toggle_retention(True)
-        self.backup_usage_changed.emit(self.use_backup_checkbox.isChecked())
+        # Block the widgets' signals while resetting them, so the dependent widgets
+        # are updated once afterwards instead of after every single change
+        widgets = (self.delete_after_checkbox, self.use_backup_checkbox, self.retention_input,
+                   self.output_format_combo, self.copy_only_checkbox, self.start_time_edit,
+                   self.end_time_edit, self.no_time_restrictions_checkbox)
+        previously_blocked = [widget.blockSignals(True) for widget in widgets]
+        try:
+            self.auto_run_checkbox.setChecked(False)
+            self.delete_after_checkbox.setChecked(True)
+            self.use_backup_checkbox.setChecked(False)
+            self.retention_input.setText('0')
+            self.output_format_combo.setCurrentText('mov')
+            self.video_codec_combo.setCurrentText('libx264')
+            self.audio_codec_combo.setCurrentText('aac')
+            self.copy_only_checkbox.setChecked(False)  # Reset copy_only to default
+            self.threads_input.setText('0')
+            self.parallel_input.setText('0')
+            self.start_time_edit.setTime(QTime(0, 0))
+            self.end_time_edit.setTime(QTime(23, 59))
+            self.no_time_restrictions_checkbox.setChecked(True)
+            # Do not reset the folder paths
+        finally:
+            for widget, blocked in zip(widgets, previously_blocked):
+                widget.blockSignals(blocked)
+        self.toggle_copy_only(self.copy_only_checkbox.checkState())
+        self.toggle_time_restrictions(True)
+        self.toggle_retention(self.delete_after_checkbox.checkState())
+        self.emit_backup_usage(self.use_backup_checkbox.isChecked())
 
     def save_settings(self):
         # Validate retention time
@@ -806,6 +1305,18 @@ class SettingsDialog(QDialog):
                 QMessageBox.critical(self, "Invalid Input", "Retention time must be an integer between 0 and 30.")
                 return
 
+        # Validate threads per file
+        threads_per_worker = self.threads_input.text()
+        if not threads_per_worker.isdigit() or int(threads_per_worker) > MAX_THREADS_PER_WORKER:
+            QMessageBox.critical(self, "Invalid Input", f"Threads per file must be an integer between 0 and {MAX_THREADS_PER_WORKER}.")
+            return
+
+        # Validate parallel conversions
+        max_parallel_jobs = self.parallel_input.text()
+        if not max_parallel_jobs.isdigit() or int(max_parallel_jobs) > MAX_PARALLEL_JOBS:
+            QMessageBox.critical(self, "Invalid Input", f"Parallel conversions must be an integer between 0 and {MAX_PARALLEL_JOBS}.")
+            return
+
         settings = {
             'auto_run': self.auto_run_checkbox.isChecked(),
             'delete_after_conversion': self.delete_after_checkbox.isChecked(),
@@ -813,11 +1324,14 @@ class SettingsDialog(QDialog):
             'use_backup': self.use_backup_checkbox.isChecked(),
             'output_format': self.output_format_combo.currentText(),
             'video_codec': self.video_codec_combo.currentText() if self.video_codec_combo.isEnabled() else None,
+            'hwaccel': self.hw_encoder_vendors.get(self.video_codec_combo.currentText()) if self.video_codec_combo.isEnabled() else None,
             'audio_codec': self.audio_codec_combo.currentText(),
             'copy_only': self.copy_only_checkbox.isChecked(),
             'start_time': self.start_time_edit.time().toString("HH:mm"),
             'end_time': self.end_time_edit.time().toString("HH:mm"),
             'no_time_restrictions': self.no_time_restrictions_checkbox.isChecked(),
+            'threads_per_worker': int(threads_per_worker),
+            'max_parallel_jobs': int(max_parallel_jobs),
             'source_folder': self.source_display.text(),
             'destination_folder': self.destination_display.text(),
             'backup_folder': self.backup_display.text(),
@@ -829,60 +1343,106 @@ class SettingsDialog(QDialog):
 # -------------------- Main Application Window -------------------- #
 
 class VideoConverterApp(QMainWindow):
+    encoders_detected = pyqtSignal(dict)  # Hardware encoder -> vendor, from the background probe
+    conversion_state_changed = pyqtSignal()  # Emitted by worker threads; updates the logo on the GUI thread
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Video Converter")
         self.setFixedHeight(300)  # Reduced vertical size by approximately 60%
         self.setMinimumWidth(600)  # Minimum horizontal size
-        self.setWindowIcon(QIcon(resource_path('icon.ico')))
+        self.setWindowIcon(load_icon(resource_path('icon.ico')))
 
         # Initialize attributes
         self.running = False
         self.thread = None
         self.stop_event = threading.Event()
+        self.scan_requested = threading.Event()
         self.status_running = False
+        self.status_dots = 0
         self.settings_window = None  # Reference to the settings window
+        self.info_dialog = None  # Created on first use and reused, its content never changes
+        self.hw_encoder_vendors = {}  # Filled in once ffmpeg has been probed
 
-        # Initialize settings
+        # Initialize settings. Changes are written to disk by a background thread.
         self.settings = load_settings()
-        self.source_folder = self.settings.get('source_folder', '')
-        self.destination_folder = self.settings.get('destination_folder', '')
-        self.backup_folder = self.settings.get('backup_folder', '')
-        self.auto_run = self.settings.get('auto_run', False)
-        self.delete_after_conversion = self.settings.get('delete_after_conversion', False)
-        self.retention_time = self.settings.get('retention_time', 0)
-        self.use_backup = self.settings.get('use_backup', False)
-        self.output_format = self.settings.get('output_format', 'mp4')
-        self.video_codec = self.settings.get('video_codec', 'libx264')
-        self.audio_codec = self.settings.get('audio_codec', 'aac')
-        self.copy_only = self.settings.get('copy_only', False)  # Load copy_only setting
+        self.settings_dirty = threading.Event()
+        self.settings_lock = threading.Lock()
+        threading.Thread(target=self.settings_writer, daemon=True).start()
+        self.load_setting_attributes()
         self.locked = self.settings.get('locked', False)  # Load the lock state
-        self.start_time = self.settings.get('start_time', '00:00')
-        self.end_time = self.settings.get('end_time', '23:59')
-        self.no_time_restrictions = self.settings.get('no_time_restrictions', True)
 
         # Initialize logging state variables
         self.last_scan_message_logged = False
         self.last_no_files_message_logged = False
         self.logged_outside_time_message = False  # For logging outside time only once
 
-        # Initialize LogEmitter and connect to GUI
-        self.log_emitter = LogEmitter()
-        self.log_emitter.log_signal.connect(self.append_log)
+        # Cached listing of the destination folder, keyed by its path and mtime
+        self.existing_outputs = set()
+        self.existing_outputs_key = None
+        # Source folder state of the last scan that found nothing to convert
+        self.empty_scan_key = None
+
+        # Initialize LogEmitter; log lines are buffered and flushed to the GUI by a timer
+        self.log_buffer = deque(maxlen=MAX_LOG_LINES)
+        self.log_emitter = LogEmitter(self.log_buffer)
 
-        # Initialize active conversion counter
+        # Initialize active conversion counter, updated by the worker threads
         self.active_conversion_count = 0
+        self.active_conversion_lock = threading.Lock()
+        self.conversion_state_changed.connect(self.update_logo)
 
         # Initialize backup usage state
         self.backup_usage_enabled = self.use_backup
 
-        # Initialize thread pool executor
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Initialize thread pool executor and the futures of the batch being converted
+        self.max_parallel_jobs = self.settings.get('max_parallel_jobs', 0) or MAX_PARALLEL
+        self.executor = ThreadPoolExecutor(max_workers=self.max_parallel_jobs, thread_name_prefix='convert')
+        self.batch_futures = {}
+        # New pool size waiting to be applied between batches (see apply_pending_pool_size).
+        # The lock is held while swapping the pool and while submitting to it.
+        self.pending_parallel_jobs = None
+        self.executor_lock = threading.Lock()
+
+        # Originals scheduled for deletion, as a heap of (deletion time, path), handled
+        # by a single thread. Loaded from disk so pending deletions survive a restart.
+        self.retention_heap = self.load_pending_deletions()
+        self.retention_cv = threading.Condition()
+        threading.Thread(target=self.retention_loop, daemon=True).start()
+
+        # Running ffmpeg processes, killed right away when conversion is stopped
+        self.ffmpeg_processes = set()
+        self.process_lock = threading.Lock()
+
+        # Originals are moved to backup or deleted by a separate thread, so the
+        # workers can start on the next file while the move is in progress. Queued
+        # originals are kept on disk until processed, so the ones left when the app
+        # quits are picked up again at the next start.
+        self.post_queue = queue.Queue(maxsize=POST_QUEUE_SIZE)
+        self.post_stop = threading.Event()
+        self.pending_originals = self.load_pending_originals()
+        self.originals_lock = threading.Lock()
+        self.post_thread = threading.Thread(target=self.post_process_originals, daemon=True)
+        self.post_thread.start()
+
+        # Watch the source folder so new files are picked up without polling
+        self.source_watcher = QFileSystemWatcher(self)
+        self.source_watcher.directoryChanged.connect(self.on_source_folder_changed)
+        self.watch_check_timer = QTimer(self)
+        self.watch_check_timer.timeout.connect(self.check_source_watch)
+
+        # Timer driving the "Status: Running..." animation
+        self.status_timer = QTimer(self)
+        self.status_timer.timeout.connect(self.tick_status)
 
         # Setup UI and system tray icon
         self.init_ui()
         self.init_tray_icon()
 
+        # Probe ffmpeg for hardware encoders without holding up the GUI
+        self.encoders_detected.connect(self.on_encoders_detected)
+        threading.Thread(target=self.detect_encoders_in_background, daemon=True).start()
+
         # Enable drag and drop
         self.setAcceptDrops(True)
 
@@ -922,14 +1482,12 @@ class VideoConverterApp(QMainWindow):
         # Logo
         logo_path = resource_path('logo.png')
         grayscale_logo_path = resource_path('grayscale_logo.png')  # Path to grayscale logo
-        if os.path.exists(logo_path) and os.path.exists(grayscale_logo_path):
+        self.logo_active = False  # The grayscale logo is shown until a conversion starts
+        if resource_exists('logo.png') and resource_exists('grayscale_logo.png'):
             try:
-                logo_pixmap = QPixmap(logo_path)
-                grayscale_logo_pixmap = QPixmap(grayscale_logo_path)
-
-                # Resize while preserving aspect ratio and adding padding
-                logo_pixmap = self.resize_image_preserve_aspect(logo_pixmap, (120, 120))
-                grayscale_logo_pixmap = self.resize_image_preserve_aspect(grayscale_logo_pixmap, (120, 120))
+                # Resized while preserving aspect ratio and adding padding
+                logo_pixmap = self.load_scaled_pixmap(logo_path, (120, 120))
+                grayscale_logo_pixmap = self.load_scaled_pixmap(grayscale_logo_path, (120, 120))
 
                 self.logo_label = QLabel()
                 self.logo_label.setPixmap(grayscale_logo_pixmap)
@@ -958,8 +1516,14 @@ class VideoConverterApp(QMainWindow):
         # Console Output
         self.console_output = QPlainTextEdit()
         self.console_output.setReadOnly(True)
+        self.console_output.setMaximumBlockCount(MAX_LOG_LINES)  # The document drops the oldest lines itself
         right_layout.addWidget(self.console_output)
 
+        # Write buffered log lines to the console in batches
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.timeout.connect(self.flush_log_buffer)
+        self.log_flush_timer.start(LOG_FLUSH_INTERVAL)
+
         # Status Indicator
         self.status_label = QLabel("Status: Idle     ")  # Added spaces to fix length
         self.status_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # Align text to the right
@@ -1003,7 +1567,7 @@ class VideoConverterApp(QMainWindow):
         Open the help document (PDF) using the default application.
         """
         help_pdf_path = resource_path('help_document.pdf')  # Replace with the actual filename
-        if os.path.exists(help_pdf_path):
+        if resource_exists('help_document.pdf'):
             QDesktopServices.openUrl(QUrl.fromLocalFile(help_pdf_path))
         else:
             log_message(f"Help document not found at path '{help_pdf_path}'.", self.log_emitter)
@@ -1024,21 +1588,15 @@ class VideoConverterApp(QMainWindow):
         self.backup_button.setEnabled(state and self.use_backup)  # Ensure backup is enabled based on use_backup
         # Start/Stop button remains active regardless of lock status
 
-    def append_log(self, message):
+    def flush_log_buffer(self):
         """
-        Append log messages to the console output.
+        Append all queued log messages to the console output in one go.
         """
-        self.console_output.appendPlainText(message)
-
-        # Limit the log window to 1000 lines
-        MAX_LOG_LINES = 1000
-        if self.console_output.blockCount() > MAX_LOG_LINES:
-            # Remove the oldest lines
-            cursor = self.console_output.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()  # Remove the newline character
+        if not self.log_buffer:
+            return
+        # Pop rather than clear, so lines appended by workers meanwhile are kept
+        lines = [self.log_buffer.popleft() for _ in range(len(self.log_buffer))]
+        self.console_output.appendPlainText("\n".join(lines))
 
     def init_tray_icon(self):
         """
@@ -1046,8 +1604,8 @@ class VideoConverterApp(QMainWindow):
         """
         self.tray_icon = QSystemTrayIcon(self)
         tray_icon_path = resource_path('icon.ico')
-        if os.path.exists(tray_icon_path):
-            self.tray_icon.setIcon(QIcon(tray_icon_path))
+        if resource_exists('icon.ico'):
+            self.tray_icon.setIcon(load_icon(tray_icon_path))
         else:
             self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
             log_message(f"Tray icon not found at path '{tray_icon_path}'. Using default icon.", self.log_emitter)
@@ -1084,6 +1642,22 @@ class VideoConverterApp(QMainWindow):
         event.ignore()
         self.hide()
 
+    def showEvent(self, event):
+        """
+        Bring the status label up to date and resume its animation.
+        """
+        super().showEvent(event)
+        self.tick_status()
+        if self.status_running:
+            self.status_timer.start(500)
+
+    def hideEvent(self, event):
+        """
+        Pause the status animation while the window is hidden (e.g. in the tray).
+        """
+        super().hideEvent(event)
+        self.status_timer.stop()
+
     def select_source_folder(self):
         """
         Open a dialog to select the source folder.
@@ -1093,8 +1667,9 @@ class VideoConverterApp(QMainWindow):
             if folder:
                 self.source_folder = folder
                 self.settings['source_folder'] = self.source_folder
-                save_settings(self.settings)
+                self.request_settings_save()
                 log_message(f"Source folder updated: {self.source_folder}", self.log_emitter)
+                self.rewatch_source_folder()
 
     def select_destination_folder(self):
         """
@@ -1105,7 +1680,7 @@ class VideoConverterApp(QMainWindow):
             if folder:
                 self.destination_folder = folder
                 self.settings['destination_folder'] = self.destination_folder
-                save_settings(self.settings)
+                self.request_settings_save()
                 log_message(f"Destination folder updated: {self.destination_folder}", self.log_emitter)
 
     def select_backup_folder(self):
@@ -1117,9 +1692,33 @@ class VideoConverterApp(QMainWindow):
             if folder:
                 self.backup_folder = folder
                 self.settings['backup_folder'] = self.backup_folder
-                save_settings(self.settings)
+                self.request_settings_save()
                 log_message(f"Backup folder updated: {self.backup_folder}", self.log_emitter)
 
+    def request_settings_save(self):
+        """
+        Mark the settings as changed so the writer thread saves them.
+        """
+        self.settings_dirty.set()
+
+    def flush_settings(self):
+        """
+        Write pending settings changes to disk.
+        """
+        with self.settings_lock:
+            if self.settings_dirty.is_set():
+                self.settings_dirty.clear()
+                save_settings(dict(self.settings))
+
+    def settings_writer(self):
+        """
+        Save the settings whenever they are marked as changed.
+        """
+        while True:
+            self.settings_dirty.wait()
+            time.sleep(SETTINGS_SAVE_DELAY)  # Coalesce bursts of changes
+            self.flush_settings()
+
     def toggle_process(self):
         """
         Toggle between starting and stopping the conversion process.
@@ -1133,22 +1732,27 @@ class VideoConverterApp(QMainWindow):
         """
         Increment the active conversion counter and update the logo.
         """
-        self.active_conversion_count += 1
-        self.update_logo()
+        with self.active_conversion_lock:
+            self.active_conversion_count += 1
+        self.conversion_state_changed.emit()
 
     def end_conversion_indicator(self):
         """
         Decrement the active conversion counter and update the logo.
         """
-        if self.active_conversion_count > 0:
+        with self.active_conversion_lock:
             self.active_conversion_count -= 1
-        self.update_logo()
+        self.conversion_state_changed.emit()
 
     def update_logo(self):
         """
         Update the logo based on the active conversion state.
         """
-        if self.running or self.active_conversion_count > 0:
+        active = self.running or self.active_conversion_count > 0
+        if active == self.logo_active:
+            return  # Already showing the right logo; avoid a needless repaint
+        self.logo_active = active
+        if active:
             if hasattr(self, 'logo_pixmap'):
                 self.logo_label.setPixmap(self.logo_pixmap)
         else:
@@ -1165,6 +1769,7 @@ class VideoConverterApp(QMainWindow):
             return
         self.running = True
         self.stop_event.clear()
+        self.watch_source_folder()
         self.start_button.setText("Stop Conversion")
         self.update_logo()  # Update logo immediately
         log_message("Conversion started.", self.log_emitter)
@@ -1183,64 +1788,148 @@ class VideoConverterApp(QMainWindow):
         """
         self.running = False
         self.stop_event.set()
+        self.scan_requested.set()  # Wake the conversion thread so it can exit
+        # Drop the files that are still queued and end the running conversions
+        for future in list(self.batch_futures):
+            future.cancel()
+        self.kill_ffmpeg_processes()
+        self.unwatch_source_folder()
         self.start_button.setText("Start Conversion")
         log_message("Conversion stopped.", self.log_emitter)
 
         # Update status label
         self.status_running = False
+        self.status_timer.stop()
         # Reset to "Status: Idle" with padding
         idle_text = "Status: Idle     "  # Pad with spaces to match length
         self.status_label.setText(idle_text)
         self.update_logo()  # Update logo immediately
 
+    def kill_ffmpeg_processes(self):
+        """
+        Kill the running ffmpeg processes. Their conversion threads see stop_event
+        as soon as the output pipe closes and clean up.
+        """
+        with self.process_lock:
+            processes = list(self.ffmpeg_processes)
+        for process in processes:
+            try:
+                process.kill()
+            except OSError:
+                pass  # Already exited
+
+    def watch_source_folder(self):
+        """
+        Start watching the source folder for changes.
+        """
+        self.unwatch_source_folder()
+        if os.path.isdir(self.source_folder):
+            self.source_watcher.addPath(self.source_folder)
+        self.watch_check_timer.start(SCAN_FALLBACK_INTERVAL * 1000)
+
+    def unwatch_source_folder(self):
+        """
+        Stop watching the source folder.
+        """
+        self.watch_check_timer.stop()
+        watched = self.source_watcher.directories()
+        if watched:
+            self.source_watcher.removePaths(watched)
+
+    def rewatch_source_folder(self):
+        """
+        Move the watch to a newly selected source folder while conversion is running,
+        and scan it straight away rather than at the next fallback scan.
+        """
+        if self.running:
+            self.watch_source_folder()
+            self.scan_requested.set()
+
+    def on_source_folder_changed(self, path):
+        """
+        Wake the conversion thread when the source folder changes.
+        """
+        self.scan_requested.set()
+
+    def check_source_watch(self):
+        """
+        Watch the source folder again if the watcher dropped it. QFileSystemWatcher
+        stops watching folders that are removed or renamed, e.g. when a network
+        share disconnects; until the folder is back the fallback scans take over.
+        """
+        if self.running and not self.source_watcher.directories() and os.path.isdir(self.source_folder):
+            self.source_watcher.addPath(self.source_folder)
+
     def run_conversion(self):
         """
         Continuously monitor the source folder and convert new videos.
         """
         try:
             while self.running and not self.stop_event.is_set():
+                self.scan_requested.clear()
                 self.convert_videos()
-                time.sleep(5)  # Interval between scans
+                # Sleep until the watcher reports a change (or the fallback interval expires)
+                self.scan_requested.wait(SCAN_FALLBACK_INTERVAL)
+                # Wait for a burst of changes to settle before rescanning
+                while self.scan_requested.is_set() and not self.stop_event.is_set():
+                    self.scan_requested.clear()
+                    self.scan_requested.wait(SCAN_SETTLE_TIME)
         except Exception as e:
             log_message(f"Error during conversion: {e}", self.log_emitter)
         finally:
             self.stop_event.set()
-            self.update_logo()  # Ensure logo is updated
-            self.status_running = False
-            # Reset to "Status: Idle" with padding
-            idle_text = "Status: Idle     "  # Pad with spaces to match length
-            self.status_label.setText(idle_text)
+            self.conversion_state_changed.emit()  # Ensure logo is updated
+            self.status_running = False  # The status timer resets the label to idle
 
     def update_status(self):
         """
-        Update the status label with a running indicator.
+        Start the running indicator in the status label.
+        """
+        self.status_dots = 0
+        self.tick_status()
+        if self.isVisible():
+            self.status_timer.start(500)
+
+    def tick_status(self):
+        """
+        Advance the running indicator by one step.
         Prevents text shifting by maintaining a fixed length for the message.
         """
-        def update():
-            base_text = "Status: Running"
-            max_dots = 3  # Maximum number of dots
-            while self.status_running:
-                for i in range(max_dots + 1):
-                    if not self.status_running:
-                        break
-                    dots = '.' * i
-                    spaces = ' ' * (max_dots - i)
-                    indicator = f"{base_text}{dots}{spaces}"
-                    self.status_label.setText(indicator)
-                    time.sleep(0.5)
+        if not self.status_running:
+            self.status_timer.stop()
             # After stopping, reset to "Status: Idle" with padding
             idle_text = "Status: Idle     "  # Pad with spaces to match length
             self.status_label.setText(idle_text)
+            return
+        base_text = "Status: Running"
+        max_dots = 3  # Maximum number of dots
+        dots = '.' * self.status_dots
+        spaces = ' ' * (max_dots - self.status_dots)
+        self.status_label.setText(f"{base_text}{dots}{spaces}")
+        self.status_dots = (self.status_dots + 1) % (max_dots + 1)
+
+    def detect_encoders_in_background(self):
+        """
+        Detect the hardware encoders on a background thread and report them to the GUI.
+        """
+        self.encoders_detected.emit(get_hw_encoder_vendors())
 
-        threading.Thread(target=update, daemon=True).start()
+    def on_encoders_detected(self, hw_encoder_vendors):
+        """
+        Store the detected hardware encoders and offer them in an open settings dialog.
+        """
+        self.hw_encoder_vendors = hw_encoder_vendors
+        if self.settings_window and self.settings_window.isVisible():
+            self.settings_window.add_hw_encoders(hw_encoder_vendors)
 
     def show_info(self):
         """
         Display the About/Info dialog.
         """
-        dialog = InfoDialog(self)
-        self.center_dialog(dialog)
-        dialog.exec_()
+        if self.info_dialog is None:
+            self.info_dialog = InfoDialog(self)
+        self.center_dialog(self.info_dialog)
+        self.info_dialog.exec_()
 
     def show_settings(self):
         """
@@ -1252,38 +1941,68 @@ class VideoConverterApp(QMainWindow):
         if self.settings_window and self.settings_window.isVisible():
             self.settings_window.activateWindow()
             return
-        self.settings_window = SettingsDialog(self.settings, self)
+        self.settings_window = SettingsDialog(self.settings, self, self.hw_encoder_vendors)
         self.center_dialog(self.settings_window)
         self.settings_window.settings_saved.connect(self.update_settings)
         self.settings_window.backup_usage_changed.connect(self.update_backup_button_state)  # Connect Signal
         self.settings_window.exec_()
 
+    def load_setting_attributes(self):
+        """
+        Copy the settings listed in APP_SETTING_ATTRIBUTES to attributes of the same name.
+        """
+        for key in APP_SETTING_ATTRIBUTES:
+            setattr(self, key, self.settings.get(key, DEFAULT_SETTINGS[key]))
+
     def update_settings(self, new_settings):
         """
         Update settings based on the settings dialog.
         """
         self.settings.update(new_settings)
-        save_settings(self.settings)
-        self.auto_run = self.settings.get('auto_run', False)
-        self.delete_after_conversion = self.settings.get('delete_after_conversion', False)
-        self.retention_time = self.settings.get('retention_time', 0)
-        self.use_backup = self.settings.get('use_backup', False)
-        self.output_format = self.settings.get('output_format', 'mp4')
-        self.video_codec = self.settings.get('video_codec', 'libx264')
-        self.audio_codec = self.settings.get('audio_codec', 'aac')
-        self.copy_only = self.settings.get('copy_only', False)  # Update copy_only setting
-        self.start_time = self.settings.get('start_time', '00:00')
-        self.end_time = self.settings.get('end_time', '23:59')
-        self.no_time_restrictions = self.settings.get('no_time_restrictions', True)
-        self.source_folder = self.settings.get('source_folder', '')
-        self.destination_folder = self.settings.get('destination_folder', '')
-        self.backup_folder = self.settings.get('backup_folder', '')
+        self.request_settings_save()
+        previous_source_folder = self.source_folder
+        self.load_setting_attributes()
         log_message("Settings updated.", self.log_emitter)
+        if self.source_folder != previous_source_folder:
+            self.rewatch_source_folder()
+
+        # Resize the worker pool if the number of parallel conversions changed; while
+        # a batch is being converted this waits until the batch is done
+        max_parallel_jobs = self.settings.get('max_parallel_jobs', 0) or MAX_PARALLEL
+        with self.executor_lock:
+            if max_parallel_jobs != self.max_parallel_jobs:
+                self.pending_parallel_jobs = max_parallel_jobs
+            else:
+                self.pending_parallel_jobs = None
+            self.apply_pending_pool_size()
 
         # Update the backup_button state based on 'use_backup'
         self.backup_button.setEnabled(self.use_backup and not self.locked)
         self.backup_usage_enabled = self.use_backup
 
+    def apply_pending_pool_size(self):
+        """
+        Replace the worker pool when the number of parallel conversions was changed,
+        unless a batch is still running on it, so a batch never spans two pools.
+        Files already queued on the old pool are still converted by it.
+        Must be called with executor_lock held.
+        """
+        if self.pending_parallel_jobs is None:
+            return
+        if any(not future.done() for future in self.batch_futures):
+            return  # Applied before the next batch is submitted
+        old_executor = self.executor
+        self.max_parallel_jobs = self.pending_parallel_jobs
+        self.pending_parallel_jobs = None
+        self.executor = ThreadPoolExecutor(max_workers=self.max_parallel_jobs, thread_name_prefix='convert')
+        old_executor.shutdown(wait=False)
+
+    def parallel_threads(self):
+        """
+        ffmpeg threads for each file while max_parallel_jobs files are converted at once.
+        """
+        return max(1, (os.cpu_count() or 2) // self.max_parallel_jobs)
+
     def toggle_lock(self):
         """
         Toggle the lock state of the application, disabling/enabling certain UI elements.
@@ -1292,7 +2011,7 @@ class VideoConverterApp(QMainWindow):
         icon_file = 'lock.ico' if not self.locked else 'unlock.ico'  # Updated file names
         icon_path = resource_path(icon_file)
 
-        if not os.path.exists(icon_path):
+        if not resource_exists(icon_file):
             log_message(f"Icon file not found at path '{icon_path}'. Using default icon.", self.log_emitter)
             icon_path = None
 
@@ -1304,7 +2023,7 @@ class VideoConverterApp(QMainWindow):
             self.locked = not self.locked
             # Save the lock state to settings
             self.settings['locked'] = self.locked
-            save_settings(self.settings)
+            self.request_settings_save()
             self.update_lock_state_ui()
             log_message(f"Application {'locked' if self.locked else 'unlocked'}.", self.log_emitter)
 
@@ -1325,12 +2044,42 @@ class VideoConverterApp(QMainWindow):
         qr.moveCenter(cp)
         dialog.move(qr.topLeft())
 
+    def load_scaled_pixmap(self, image_path, size):
+        """
+        Load an image resized with resize_image_preserve_aspect. The resized image is
+        cached in the app data folder so it only has to be scaled on the first launch.
+        The cache is keyed by the image's file size rather than its modification time,
+        as the one-file PyInstaller build extracts the images anew on every launch.
+        """
+        name = os.path.splitext(os.path.basename(image_path))[0]
+        cache_prefix = f"{name}_{size[0]}x{size[1]}_"
+        cache_name = f"{cache_prefix}{os.path.getsize(image_path)}.png"
+        cache_path = os.path.join(cache_folder, cache_name)
+        if os.path.exists(cache_path):
+            pixmap = QPixmap(cache_path)
+            if not pixmap.isNull():
+                return pixmap
+        # Remove images cached for a previous version of the image
+        with os.scandir(cache_folder) as entries:
+            for entry in entries:
+                if entry.name.startswith(cache_prefix) and entry.name != cache_name:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+        pixmap = self.resize_image_preserve_aspect(QPixmap(image_path), size)
+        if not pixmap.save(cache_path, 'PNG'):
+            logger.warning(f"Could not cache resized image at '{cache_path}'.")
+        return pixmap
+
     def resize_image_preserve_aspect(self, pixmap, size):
         """
         Resize a QPixmap while preserving aspect ratio and adding padding if necessary.
         """
         try:
             scaled_pixmap = pixmap.scaled(size[0], size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if scaled_pixmap.width() == size[0] and scaled_pixmap.height() == size[1]:
+                return scaled_pixmap  # Same aspect ratio, no padding needed
             final_pixmap = QPixmap(size[0], size[1])
             final_pixmap.fill(Qt.transparent)
             painter = QPainter(final_pixmap)
@@ -1351,9 +2100,22 @@ class VideoConverterApp(QMainWindow):
         """
         self.running = False
         self.status_running = False
+        self.stop_event.set()
+        self.kill_ffmpeg_processes()
         if self.thread and self.thread.is_alive():
-            self.stop_event.set()
+            self.scan_requested.set()
             self.thread.join(timeout=5)
+        # Discard queued conversions without waiting for the running ones
+        with self.executor_lock:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        # Stop the post-processing thread after the original it's working on. The ones
+        # still queued, or a cross-volume move cut short, are redone at the next start.
+        self.post_stop.set()
+        try:
+            self.post_queue.put_nowait(None)  # Wake the thread if it's waiting for work
+        except queue.Full:
+            pass  # It isn't waiting, and checks post_stop before taking the next original
+        self.post_thread.join(timeout=5)
         self.tray_icon.hide()
 
         # Clean up the local server
@@ -1361,6 +2123,12 @@ class VideoConverterApp(QMainWindow):
             self.local_server.close()
             self.local_server.removeServer("VideoConverterAppInstance")
 
+        # Save pending settings and deletions and write out any queued log records
+        self.flush_settings()
+        with self.retention_cv:
+            self.save_pending_deletions()
+        stop_log_listener()
+
         QApplication.quit()
 
     # -------------------- Drag and Drop Events -------------------- #
@@ -1389,25 +2157,30 @@ class VideoConverterApp(QMainWindow):
         urls = event.mimeData().urls()
         dropped_files = [url.toLocalFile() for url in urls]
 
-        # Supported formats
-        supported_formats = (
-            '.mp4', '.avi', '.wmv', '.mkv', '.flv', '.webm', '.mov', '.mpeg',
-            '.mpg', '.m4v', '.3gp', '.ts', '.vob', '.rm', '.rmvb', '.asf',
-            '.m2ts', '.mts', '.ogv', '.divx', '.dv', '.f4v', '.mxf', '.nut',
-            '.ogm', '.qt', '.tod', '.vro'
-        )
-
+        supported_files = []
         unsupported_files = []
         for file_path in dropped_files:
-            if os.path.isfile(file_path) and file_path.lower().endswith(supported_formats):
-                self.executor.submit(self.convert_file, file_path)
+            if os.path.splitext(file_path)[1].lower() in SUPPORTED_FORMATS and os.path.isfile(file_path):
+                supported_files.append(file_path)
             else:
                 unsupported_files.append(file_path)
 
+        if supported_files:
+            with self.executor_lock:
+                self.apply_pending_pool_size()
+                threads = self.parallel_threads()
+                for file_path in supported_files:
+                    self.executor.submit(self.convert_file, file_path, None, threads)
+
         if unsupported_files:
             unsupported_list = "\n".join(unsupported_files)
-            QMessageBox.warning(self, "Unsupported Files", f"The following files are not supported and were not converted:\n{unsupported_list}")
             log_message(f"Unsupported files dropped:\n{unsupported_list}", self.log_emitter)
+            message = f"The following files are not supported and were not converted:\n{unsupported_list}"
+            # Notify through the tray so the drop doesn't block on a modal dialog
+            if self.tray_icon.isVisible() and QSystemTrayIcon.supportsMessages():
+                self.tray_icon.showMessage("Unsupported Files", message, QSystemTrayIcon.Warning)
+            else:
+                QMessageBox.warning(self, "Unsupported Files", message)
 
     def is_within_allowed_hours(self):
         """
@@ -1417,12 +2190,8 @@ class VideoConverterApp(QMainWindow):
             return True
 
         current_time = datetime.now().time()
-        # Parse start_time and end_time from settings
-        start_time_str = self.start_time
-        end_time_str = self.end_time
-        # Adjust time format based on system settings
-        start_time = datetime.strptime(start_time_str, "%H:%M").time()
-        end_time = datetime.strptime(end_time_str, "%H:%M").time()
+        start_time = parse_settings_time(self.start_time)
+        end_time = parse_settings_time(self.end_time)
 
         if start_time <= end_time:
             return start_time <= current_time <= end_time
@@ -1430,171 +2199,268 @@ class VideoConverterApp(QMainWindow):
             # Time range crosses midnight
             return current_time >= start_time or current_time <= end_time
 
-    def has_audio_stream(self, file_path):
+    def check_allowed_hours(self):
         """
-        Check if the file has an audio stream.
-        """
-        command = [resource_path('ffprobe.exe'), '-v', 'error', '-select_streams', 'a', '-show_entries',
-                   'stream=codec_type', '-of', 'default=nw=1', file_path]
-        startupinfo, creationflags = get_subprocess_startupinfo()
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
-                                startupinfo=startupinfo, creationflags=creationflags)
-        return 'codec_type=audio' in result.stdout
-
-    def convert_file(self, file_path):
-        """
-        Convert a single file.
+        Check the allowed conversion times, logging (once) when outside of them.
         """
         if not self.is_within_allowed_hours():
             if not self.logged_outside_time_message:
                 log_message(f"Current time is outside the allowed conversion times ({self.start_time} to {self.end_time}).", self.log_emitter)
                 self.logged_outside_time_message = True
-            return
-
+            return False
         self.logged_outside_time_message = False  # Reset the flag
+        return True
+
+    def has_audio_stream(self, file_path):
+        """
+        Check if the file has an audio stream. Files without one stay in the source
+        folder, so the result is cached to avoid probing them again on every scan.
+        """
+        stat = os.stat(file_path)
+        return probe_audio_stream(file_path, stat.st_size, stat.st_mtime_ns)
+
+    def get_output_name(self, file_name):
+        """
+        Name of the converted (or copied) file in the destination folder.
+        """
+        return file_name if self.copy_only else os.path.splitext(file_name)[0] + f'.{self.output_format}'
+
+    def process_original(self, file_path):
+        """
+        Move the original file to the backup folder or delete it, as configured.
+        """
+        file_name = os.path.basename(file_path)
+
+        # Move original to backup if needed
+        if self.use_backup and self.backup_folder:
+            try:
+                backup_file_path = os.path.join(self.backup_folder, file_name)
+                move_file(file_path, backup_file_path)
+                log_message(f"Moved {file_name} to backup folder.", self.log_emitter)
+            except OSError as e:
+                log_message(f"Error moving {file_name} to backup folder: {e}", self.log_emitter)
+
+        # Delete original file if enabled
+        if self.delete_after_conversion and not self.use_backup:
+            if self.retention_time > 0:
+                deadline = time.time() + self.retention_time * 86400  # Retention time is in days
+                self.schedule_deletion(file_path, deadline)
+                deletion_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(deadline))
+                log_message(f"Scheduled deletion for {file_name} at {deletion_time}", self.log_emitter)
+            else:
+                self.delete_file(file_path)
+
+    def queue_original(self, file_path):
+        """
+        Queue the original of a converted file for post_process_originals.
+        """
+        with self.originals_lock:
+            self.pending_originals.add(file_path)
+            self.save_pending_originals()
+        # Once the app is quitting the original is only kept on disk for the next start
+        while not self.post_stop.is_set():
+            try:
+                self.post_queue.put(file_path, timeout=1)
+                return
+            except queue.Full:
+                pass
+
+    def post_process_originals(self):
+        """
+        Process the originals left over from the previous session, then the ones
+        queued by the workers, until a None sentinel is queued or post_stop is set.
+        """
+        with self.originals_lock:
+            leftovers = list(self.pending_originals)
+        for file_path in leftovers:
+            if self.post_stop.is_set():
+                return
+            self.finish_original(file_path)
+        while not self.post_stop.is_set():
+            file_path = self.post_queue.get()
+            if file_path is None:
+                break
+            self.finish_original(file_path)
+
+    def finish_original(self, file_path):
+        """
+        Process a queued original and remove it from the pending originals.
+        """
+        try:
+            self.process_original(file_path)
+        except Exception as e:
+            log_message(f"Error processing original {file_path}: {e}", self.log_emitter)
+        with self.originals_lock:
+            self.pending_originals.discard(file_path)
+            self.save_pending_originals()
+
+    def convert_file(self, file_path, destination_file=None, threads=None):
+        """
+        Convert a single file. The destination path is derived from the settings
+        unless the caller has already computed it. threads is the ffmpeg thread
+        count (by default a share of the cores for max_parallel_jobs conversions)
+        used unless the threads_per_worker setting overrides it.
+        Returns True if the file was converted (or copied) successfully.
+        """
+        if not self.check_allowed_hours():
+            return False
+
         self.start_conversion_indicator()  # Indicate conversion start
         try:
             file_name = os.path.basename(file_path)
-            destination_file = os.path.join(
-                self.destination_folder,
-                file_name if self.copy_only else os.path.splitext(file_name)[0] + f'.{self.output_format}'
-            )
+            if destination_file is None:
+                destination_file = os.path.join(self.destination_folder, self.get_output_name(file_name))
 
             # Check if output file already exists
             if os.path.exists(destination_file):
                 log_message(f"Output file already exists: {destination_file}", self.log_emitter)
-                return
+                return False
 
             if self.copy_only:
                 # Copy the file directly
                 try:
                     log_message(f"Copying: {file_name}", self.log_emitter)
-                    shutil.copy2(file_path, destination_file)
+                    copy_file(file_path, destination_file)
                     log_message(f"Successfully copied: {file_name}", self.log_emitter)
-
-                    # Move original to backup if needed
-                    if self.use_backup and self.backup_folder:
-                        try:
-                            backup_file_path = os.path.join(self.backup_folder, file_name)
-                            os.rename(file_path, backup_file_path)
-                            log_message(f"Moved {file_name} to backup folder.", self.log_emitter)
-                        except OSError as e:
-                            log_message(f"Error moving {file_name} to backup folder: {e}", self.log_emitter)
-
-                    # Delete original file after copying if enabled
-                    if self.delete_after_conversion and not self.use_backup:
-                        if self.retention_time > 0:
-                            deletion_time = datetime.now() + timedelta(days=self.retention_time)
-                            log_message(f"Scheduled deletion for {file_name} at {deletion_time.strftime('%Y-%m-%d %H:%M:%S')}", self.log_emitter)
-                            threading.Timer(self.retention_time * 86400, self.delete_file, args=(file_path,)).start()
-                        else:
-                            self.delete_file(file_path)
+                    self.queue_original(file_path)
+                    return True
                 except Exception as e:
                     log_message(f"Error copying {file_path}: {e}", self.log_emitter)
-                return  # Skip conversion
-
-            # Proceed with conversion
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_fixed_file = os.path.join(temp_dir, 'fixed_' + file_name)
-                preprocess_needed = True  # Assume preprocessing is needed
+                return False  # Skip conversion
+
+            # Check for audio stream if converting to mp3
+            if self.output_format == 'mp3':
+                if not self.has_audio_stream(file_path):
+                    log_message(f"No audio stream found in {file_name}. Cannot convert to mp3.", self.log_emitter)
+                    return False
+
+            # Convert the file directly; ffmpeg is told to tolerate damaged input
+            if threads is None:
+                threads = self.parallel_threads()
+            threads = self.threads_per_worker or threads
+            log_message(f"Converting: {file_name}", self.log_emitter)
+            command = self.build_ffmpeg_command(file_path, destination_file, threads)
+            error_lines = []
+            return_code = self.run_ffmpeg(command, file_name, destination_file, error_lines)
+            hw_decode = True
+
+            if (return_code and '-hwaccel' in command
+                    and not any(FFMPEG_CONTAINER_ERROR.search(line) for line in error_lines)):
+                # Hardware decoding doesn't support every input; retry once decoding on the CPU
+                log_message(f"Converting {file_name} failed with code {return_code}, retrying without hardware decoding.", self.log_emitter)
+                hw_decode = False
+                error_lines.clear()
+                command = self.build_ffmpeg_command(file_path, destination_file, threads, hw_decode)
+                return_code = self.run_ffmpeg(command, file_name, destination_file, error_lines)
+
+            if return_code and any(FFMPEG_CONTAINER_ERROR.search(line) for line in error_lines):
+                # The conversion failed on a broken container; remuxing it first into a
+                # temporary copy may fix it, so retry once from that copy
+                log_message(f"Converting {file_name} failed with code {return_code}, retrying after preprocessing.", self.log_emitter)
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    temp_fixed_file = os.path.join(temp_dir, 'fixed_' + file_name)
+                    # The remux runs like a conversion (see run_ffmpeg), so stopping or
+                    # quitting kills it and the temporary directory can be cleaned up
+                    preprocess_command = [*FFMPEG_COMMAND_PREFIX, '-i', file_path, '-c', 'copy', temp_fixed_file]
+                    if self.stop_event.is_set():
+                        return False
+                    log_message(f"Preprocessing: {file_name} to fix potential corruption", self.log_emitter)
+                    preprocess_code = self.run_ffmpeg(preprocess_command, file_name, temp_fixed_file)
+                    if preprocess_code != 0:
+                        if preprocess_code is not None:
+                            log_message(f"Error preprocessing {file_path}: ffmpeg exited with code {preprocess_code}", self.log_emitter)
+                        return False
+                    log_message(f"Converting: {file_name} (preprocessed)", self.log_emitter)
+                    command = self.build_ffmpeg_command(temp_fixed_file, destination_file, threads, hw_decode)
+                    return_code = self.run_ffmpeg(command, file_name, destination_file)
+
+            if return_code == 0:
+                log_message(f"Successfully converted: {file_name}", self.log_emitter)
+                self.queue_original(file_path)
+                return True
+            if return_code is not None:
+                log_message(f"Error converting {file_name}: ffmpeg exited with code {return_code}", self.log_emitter)
+            return False
+        finally:
+            self.end_conversion_indicator()  # Indicate conversion end
 
-                # Introduce an option to skip preprocessing unless corruption is detected
-                try:
-                    # Check if file is corrupted using ffprobe
-                    probe_command = [resource_path('ffprobe.exe'), '-v', 'error', '-i', file_path]
-                    startupinfo, creationflags = get_subprocess_startupinfo()
-                    subprocess.run(
-                        probe_command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        check=True,
-                        startupinfo=startupinfo,
-                        creationflags=creationflags
-                    )
-                    preprocess_needed = False
-                    log_message(f"No corruption detected in {file_name}. Skipping preprocessing.", self.log_emitter)
-                except subprocess.CalledProcessError:
-                    log_message(f"Corruption detected in {file_name}. Preprocessing required.", self.log_emitter)
-
-                if preprocess_needed:
-                    preprocess_command = [resource_path('ffmpeg.exe'), '-i', file_path, '-c', 'copy', temp_fixed_file]
-                    try:
-                        log_message(f"Preprocessing: {file_name} to fix potential corruption", self.log_emitter)
-                        startupinfo, creationflags = get_subprocess_startupinfo()
-                        subprocess.run(
-                            preprocess_command,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            check=True,
-                            startupinfo=startupinfo,
-                            creationflags=creationflags
-                        )
-                    except subprocess.CalledProcessError as e:
-                        log_message(f"Error preprocessing {file_path}: {e.stderr}", self.log_emitter)
-                        return
-                    input_file = temp_fixed_file
-                else:
-                    input_file = file_path
-
-                # Check for audio stream if converting to mp3
-                if self.output_format == 'mp3':
-                    if not self.has_audio_stream(input_file):
-                        log_message(f"No audio stream found in {file_name}. Cannot convert to mp3.", self.log_emitter)
-                        return
-
-                # Build FFMPEG command
-                output_file_path = destination_file
-                command = self.build_ffmpeg_command(input_file, output_file_path)
-                startupinfo, creationflags = get_subprocess_startupinfo()
+    def run_ffmpeg(self, command, file_name, output_file, error_lines=None):
+        """
+        Run an ffmpeg conversion, logging its progress and errors (which are also
+        appended to error_lines, if given). A failed conversion's output is removed.
+        Returns ffmpeg's exit code, or None if the conversion was stopped or ffmpeg
+        couldn't be run.
+        """
+        process = None
+        try:
+            # Output is read as bytes; only the lines that get logged are decoded
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                startupinfo=STARTUPINFO,
+                creationflags=CREATIONFLAGS,
+                **FFMPEG_POPEN_OPTIONS
+            )
+            with self.process_lock:
+                self.ffmpeg_processes.add(process)
+            progress = {}
+            next_progress_log = time.monotonic() + PROGRESS_LOG_INTERVAL
+            for line in process.stdout:
+                if self.stop_event.is_set():
+                    break
+                if FFMPEG_PROGRESS_LINE.match(line):
+                    # Progress report (frame=..., out_time=..., progress=continue/end),
+                    # a block of lines ending with progress=
+                    key, _, value = line.rstrip().partition(b'=')
+                    progress[key] = value
+                    if key == b'progress' and value == b'continue' and time.monotonic() >= next_progress_log:
+                        next_progress_log = time.monotonic() + PROGRESS_LOG_INTERVAL
+                        frame = progress.get(b'frame', b'0').decode()
+                        out_time = progress.get(b'out_time', b'').split(b'.')[0].decode()
+                        log_message(f"Converting {file_name}: frame {frame}, time {out_time}", self.log_emitter)
+                    continue
+                line = line.strip()
+                if line:
+                    error_line = line.decode(errors='replace')  # ffmpeg error output
+                    log_message(error_line, self.log_emitter)
+                    if error_lines is not None:
+                        error_lines.append(error_line)
 
-                try:
-                    log_message(f"Converting: {file_name}", self.log_emitter)
-                    process = subprocess.Popen(
-                        command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        startupinfo=startupinfo,
-                        creationflags=creationflags
-                    )
-                    for line in process.stdout:
-                        if self.stop_event.is_set():
-                            process.kill()
-                            log_message(f"Conversion of {file_name} stopped.", self.log_emitter)
-                            return
-                        log_message(line.strip(), self.log_emitter)
-
-                    return_code = process.wait()
-                    if return_code == 0:
-                        log_message(f"Successfully converted: {file_name}", self.log_emitter)
-
-                        # Move original to backup if needed
-                        if self.use_backup and self.backup_folder:
-                            try:
-                                backup_file_path = os.path.join(self.backup_folder, file_name)
-                                os.rename(file_path, backup_file_path)
-                                log_message(f"Moved {file_name} to backup folder.", self.log_emitter)
-                            except OSError as e:
-                                log_message(f"Error moving {file_name} to backup folder: {e}", self.log_emitter)
-
-                        # Delete original file after conversion if enabled
-                        if self.delete_after_conversion and not self.use_backup:
-                            if self.retention_time > 0:
-                                deletion_time = datetime.now() + timedelta(days=self.retention_time)
-                                log_message(f"Scheduled deletion for {file_name} at {deletion_time.strftime('%Y-%m-%d %H:%M:%S')}", self.log_emitter)
-                                threading.Timer(self.retention_time * 86400, self.delete_file, args=(file_path,)).start()
-                            else:
-                                self.delete_file(file_path)
-                    else:
-                        log_message(f"Error converting {file_name}: ffmpeg exited with code {return_code}", self.log_emitter)
-                        return
-
-                except FileNotFoundError:
-                    log_message("ffmpeg not found.", self.log_emitter)
-                except Exception as e:
-                    log_message(f"Error converting {file_name}: {e}", self.log_emitter)
+            if self.stop_event.is_set():
+                process.kill()  # No-op if stop_conversion already killed it
+            return_code = process.wait()
+            if return_code != 0:
+                # Don't leave a partial file behind, the next scan would take it for a finished conversion
+                if os.path.exists(output_file):
+                    os.remove(output_file)
+                if self.stop_event.is_set():
+                    log_message(f"Conversion of {file_name} stopped.", self.log_emitter)
+                    return None
+            return return_code
+
+        except FileNotFoundError:
+            log_message("ffmpeg not found.", self.log_emitter)
+        except Exception as e:
+            log_message(f"Error converting {file_name}: {e}", self.log_emitter)
+            if process is not None and os.path.exists(output_file):
+                os.remove(output_file)
         finally:
-            self.end_conversion_indicator()  # Indicate conversion end
+            with self.process_lock:
+                self.ffmpeg_processes.discard(process)
+        return None
+
+    def get_existing_outputs(self):
+        """
+        Return the (normcase'd) names in the destination folder. The folder is only
+        re-read when its modification time changes, i.e. when entries were added or removed.
+        """
+        key = (self.destination_folder, os.stat(self.destination_folder).st_mtime_ns)
+        if key != self.existing_outputs_key:
+            with os.scandir(self.destination_folder) as entries:
+                self.existing_outputs = {os.path.normcase(entry.name) for entry in entries}
+            self.existing_outputs_key = key
+        return self.existing_outputs
 
     def convert_videos(self):
         """
@@ -1604,27 +2470,30 @@ class VideoConverterApp(QMainWindow):
             log_message("Error: Source or destination folder does not exist.", self.log_emitter)
             return
 
-        if not self.is_within_allowed_hours():
-            if not self.logged_outside_time_message:
-                log_message(f"Current time is outside the allowed conversion times ({self.start_time} to {self.end_time}).", self.log_emitter)
-                self.logged_outside_time_message = True
+        if not self.check_allowed_hours():
             return
-        else:
-            self.logged_outside_time_message = False  # Reset the flag
-
-        # Supported input formats
-        supported_formats = (
-            '.mp4', '.avi', '.wmv', '.mkv', '.flv', '.webm', '.mov', '.mpeg',
-            '.mpg', '.m4v', '.3gp', '.ts', '.vob', '.rm', '.rmvb', '.asf',
-            '.m2ts', '.mts', '.ogv', '.divx', '.dv', '.f4v', '.mxf', '.nut',
-            '.ogm', '.qt', '.tod', '.vro'
-        )
-        new_files = [
-            os.path.join(self.source_folder, f) for f in os.listdir(self.source_folder)
-            if f.lower().endswith(supported_formats) and
-            not os.path.exists(os.path.join(self.destination_folder, f if self.copy_only else os.path.splitext(f)[0] + f'.{self.output_format}'))
-        ]
+
+        # Compare against the cached destination listing instead of checking every candidate with os.path.exists
+        existing = self.get_existing_outputs()
+        # Skip listing the source folder if neither folder changed since a scan that
+        # found nothing to convert; files added or removed update the folder's mtime
+        scan_key = (self.source_folder, os.stat(self.source_folder).st_mtime_ns,
+                    self.existing_outputs_key, self.output_format, self.copy_only)
+        if scan_key == self.empty_scan_key:
+            return
+        # Collect (source path, destination path) pairs, computing each path only once
+        new_files = []
+        destination_folder = self.destination_folder
+        get_output_name = self.get_output_name
+        with os.scandir(self.source_folder) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in SUPPORTED_FORMATS or not entry.is_file():
+                    continue
+                output_name = get_output_name(entry.name)
+                if os.path.normcase(output_name) not in existing:
+                    new_files.append((entry.path, os.path.join(destination_folder, output_name)))
         if not new_files:
+            self.empty_scan_key = scan_key
             if not self.last_scan_message_logged:
                 log_message("Scanning source folder...", self.log_emitter)
                 self.last_scan_message_logged = True
@@ -1635,59 +2504,167 @@ class VideoConverterApp(QMainWindow):
         self.last_scan_message_logged = False
         self.last_no_files_message_logged = False
 
-        for file_path in new_files:
+        # Dispatch the batch to the worker pool and wait for it to finish, so the
+        # next scan doesn't pick up files that are still being converted
+        with self.executor_lock:
+            self.apply_pending_pool_size()
+            if len(new_files) == 1:
+                threads = FFMPEG_THREADS_SINGLE
+            else:
+                threads = self.parallel_threads()
+            futures = {
+                self.executor.submit(self.convert_file, file_path, destination_file, threads): file_path
+                for file_path, destination_file in new_files
+            }
+            self.batch_futures = futures
+        converted = 0
+        for future in as_completed(futures):
             if self.stop_event.is_set():
+                for pending in futures:
+                    pending.cancel()
                 log_message("Process stopped before completing all files.", self.log_emitter)
                 return
-            self.executor.submit(self.convert_file, file_path)
+            try:
+                if future.result():
+                    converted += 1
+            except Exception as e:
+                log_message(f"Error converting {os.path.basename(futures[future])}: {e}", self.log_emitter)
+        log_message(f"Batch finished: {converted} of {len(new_files)} files processed.", self.log_emitter)
 
-    def build_ffmpeg_command(self, input_file, output_file):
+    def build_ffmpeg_command(self, input_file, output_file, threads, hw_decode=True):
         """
         Build the appropriate FFMPEG command based on available GPU encoders.
+        With hw_decode=False the input is decoded on the CPU even if the GPU could decode it.
         """
-        gpu_encoder = self.get_gpu_encoder()
+        gpu_encoder = self.get_gpu_encoder() if self.output_format != 'mp3' else None
         if self.output_format == 'mp3':
-            command = [
-                resource_path('ffmpeg.exe'), '-y', '-i', input_file,
+            options = [
+                '-i', input_file,
                 '-vn',  # Skip video stream
-                '-acodec', self.audio_codec or 'libmp3lame',  # Audio codec for mp3
-                output_file
+                '-acodec', self.audio_codec or 'libmp3lame'  # Audio codec for mp3
             ]
             log_message("Building command for audio-only conversion to mp3.", self.log_emitter)
         elif gpu_encoder:
-            # Choose encoder based on the desired output format's codec
-            video_codec = gpu_encoder.get('h264', self.video_codec)
-            command = [
-                resource_path('ffmpeg.exe'), '-y', '-i', input_file,
-                '-vcodec', video_codec,
-                '-acodec', self.audio_codec,
-                output_file
+            # Use the hardware encoder picked in the settings, otherwise the vendor's H.264 encoder
+            hw_encoder_vendors = get_hw_encoder_vendors()
+            if self.hwaccel is not None and hw_encoder_vendors.get(self.video_codec) == self.hwaccel:
+                video_codec = self.video_codec
+            else:
+                video_codec = gpu_encoder.get('h264', self.video_codec)
+            # The vendor's options only apply to its own encoders
+            output_options = gpu_encoder.get('output_options', []) if video_codec in hw_encoder_vendors else []
+            options = [
+                *(gpu_encoder.get('input_options', []) if hw_decode else []), '-i', input_file,
+                '-vcodec', video_codec, *output_options,
+                '-acodec', self.audio_codec
             ]
             log_message(f"Using GPU encoder: {video_codec}", self.log_emitter)
         else:
-            # Fallback to CPU-based encoding
-            command = [
-                resource_path('ffmpeg.exe'), '-y', '-i', input_file,
-                '-vcodec', self.video_codec,
-                '-acodec', self.audio_codec,
-                output_file
+            # Fallback to CPU-based encoding. A hardware encoder selected in the
+            # settings is no longer available, so use libx264 instead.
+            video_codec = 'libx264' if self.hwaccel else self.video_codec
+            options = [
+                '-i', input_file,
+                '-vcodec', video_codec,
+                '-acodec', self.audio_codec
             ]
             log_message("Using CPU encoder.", self.log_emitter)
-        return command
+        return [*FFMPEG_COMMAND_PREFIX, *options, '-threads', str(threads), output_file]
 
     def get_gpu_encoder(self):
         """
-        Detect available GPU encoders.
-        """
-        if 'nvidia' in GPU_ENCODERS:
-            return GPU_ENCODERS['nvidia']
-        elif 'intel' in GPU_ENCODERS:
-            return GPU_ENCODERS['intel']
-        elif 'amd' in GPU_ENCODERS:
-            return GPU_ENCODERS['amd']
+        Detect available GPU encoders. The vendor of the hardware encoder selected
+        in the settings takes precedence.
+        """
+        encoders = get_supported_encoders()
+        if self.hwaccel in encoders:
+            return encoders[self.hwaccel]
+        elif 'nvidia' in encoders:
+            return encoders['nvidia']
+        elif 'intel' in encoders:
+            return encoders['intel']
+        elif 'amd' in encoders:
+            return encoders['amd']
+        elif 'apple' in encoders:
+            return encoders['apple']
         else:
             return None
 
+    def load_pending_deletions(self):
+        """
+        Load the deletions scheduled in a previous session.
+        """
+        try:
+            with open(pending_deletions_path, 'r') as f:
+                heap = [(float(deadline), path) for deadline, path in json.load(f)]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Error loading pending deletions: {e}")
+            return []
+        heapq.heapify(heap)
+        return heap
+
+    def save_pending_deletions(self):
+        """
+        Write the scheduled deletions to disk. Call with retention_cv held.
+        """
+        try:
+            temp_path = pending_deletions_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(self.retention_heap, f)
+            os.replace(temp_path, pending_deletions_path)
+        except OSError as e:
+            logger.error(f"Error saving pending deletions: {e}")
+
+    def load_pending_originals(self):
+        """
+        Load the originals left unprocessed in a previous session, skipping the ones
+        that no longer exist.
+        """
+        try:
+            with open(pending_originals_path, 'r') as f:
+                return {path for path in json.load(f) if os.path.exists(path)}
+        except FileNotFoundError:
+            return set()
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Error loading pending originals: {e}")
+            return set()
+
+    def save_pending_originals(self):
+        """
+        Write the pending originals to disk. Call with originals_lock held.
+        """
+        try:
+            temp_path = pending_originals_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(sorted(self.pending_originals), f)
+            os.replace(temp_path, pending_originals_path)
+        except OSError as e:
+            logger.error(f"Error saving pending originals: {e}")
+
+    def schedule_deletion(self, file_path, deadline):
+        """
+        Delete file_path at deadline (a time.time() timestamp).
+        """
+        with self.retention_cv:
+            heapq.heappush(self.retention_heap, (deadline, file_path))
+            self.save_pending_deletions()
+            self.retention_cv.notify()
+
+    def retention_loop(self):
+        """
+        Delete scheduled files once their deletion time has passed.
+        """
+        while True:
+            with self.retention_cv:
+                while not self.retention_heap or self.retention_heap[0][0] > time.time():
+                    timeout = self.retention_heap[0][0] - time.time() if self.retention_heap else None
+                    self.retention_cv.wait(timeout)
+                _, file_path = heapq.heappop(self.retention_heap)
+                self.save_pending_deletions()
+            self.delete_file(file_path)
+
     def delete_file(self, file_path):
         """
         Delete a file from the filesystem.
@@ -1701,22 +2678,60 @@ class VideoConverterApp(QMainWindow):
 
 # -------------------- PyQt5 Application Execution -------------------- #
 
-def main():
-    app = QApplication(sys.argv)
+def another_instance_running(app_name):
+    """
+    Check whether another instance is running by connecting to its local server.
+    On Windows the server's named pipe is probed directly, which (unlike
+    QLocalSocket) works before the QApplication has been created.
+    """
+    if os.name == 'nt':
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        if kernel32.WaitNamedPipeW(rf'\\.\pipe\{app_name}', 100):
+            return True
+        # A timeout means the pipe exists but is busy; only a missing pipe means no instance
+        return ctypes.get_last_error() != 2  # ERROR_FILE_NOT_FOUND
+    socket = QLocalSocket()
+    socket.connectToServer(app_name)
+    running = socket.waitForConnected(100)
+    socket.abort()
+    return running
+
+def exit_already_running():
+    """
+    Tell the user another instance is already running and exit.
+    """
+    log_message("Another instance is already running.", None)
+    title = "Application Already Running"
+    text = "Another instance of the application is already running."
+    if os.name == 'nt':
+        # Shown without Qt, as the QApplication may not have been created
+        ctypes.windll.user32.MessageBoxW(None, text, title, 0x30)  # MB_ICONWARNING
+    else:
+        QMessageBox.warning(None, title, text)
+    sys.exit()
 
+def main():
     # Unique name for your application
     app_name = "VideoConverterAppInstance"
 
-    # Remove existing server if needed (handles crashes)
-    existing_server = QLocalServer()
-    existing_server.removeServer(app_name)
+    # On Windows a running instance is detected (through its named pipe) before the
+    # QApplication is created, so a second launch exits without loading Qt's GUI.
+    # Elsewhere QLocalSocket needs the application object to exist first.
+    app = None
+    if os.name != 'nt':
+        app = QApplication(sys.argv)
+    if another_instance_running(app_name):
+        exit_already_running()
+    if app is None:
+        app = QApplication(sys.argv)
+
+    # No instance answered, so a server left behind by a crash can be removed
+    QLocalServer.removeServer(app_name)
 
     # Create a local server
     local_server = QLocalServer()
     if not local_server.listen(app_name):
-        log_message("Another instance is already running.", None)
-        QMessageBox.warning(None, "Application Already Running", "Another instance of the application is already running.")
-        sys.exit()
+        exit_already_running()
     else:
         window = VideoConverterApp()
         window.show()